@@ -12,6 +12,9 @@ Example usage:
     # Force rewrite existing fixtures
     python scripts/gen_fixtures.py --force-rewrite
 
+    # Save fixtures as compact gzipped JSON
+    python scripts/gen_fixtures.py --gzip
+
     # Generate mock code for httpx_mock
     python scripts/gen_fixtures.py --gen-mock
 
@@ -34,18 +37,21 @@ os.environ["HTTPX_TIMEOUT"] = "30.0"
 #         super().__init__(*args, **kwargs)
 # httpx.Client = CustomClient
 
-import json
+import asyncio
+import gzip
 import logging
 import argparse
 import sys
 from pathlib import Path
+from urllib.parse import urlencode
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import hishel
-from yarasp import YaraspClient
+from yarasp import AsyncYaraspClient
+from yarasp.utils import json_dumps
 from scripts.fixture_requests import REQUESTS
 
 logging.basicConfig(level=logging.INFO)
@@ -53,39 +59,97 @@ logging.basicConfig(level=logging.INFO)
 # Default cache directory used by hishel FileStorage
 DEFAULT_CACHE_DIR = "tests/.cache/hishel"
 
-def count_cache_files(cache_dir=DEFAULT_CACHE_DIR):
-    """Count the number of cache files in the cache directory."""
-    if not os.path.exists(cache_dir):
-        return 0
-    cache_path = Path(cache_dir)
-    # Count all files recursively in the cache directory
-    return len(list(cache_path.rglob("*")))
+# Endpoints with huge responses which are saved to disk as is (compact JSON)
+RAW_ENDPOINTS = {"stations_list"}
+
+# Fast compression level, huge fixtures are still several times smaller than plain JSON
+GZIP_COMPRESSLEVEL = 3
+
+def list_cache_files(cache_path):
+    """Return names of cache files in existing cache directory (hishel FileStorage keeps them flat)."""
+    with os.scandir(cache_path) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def open_fixture(fixture_file):
+    """Open fixture file for binary writing, gzip-compressed if its name ends with .gz."""
+    if fixture_file.endswith(".gz"):
+        return gzip.open(fixture_file, "wb", compresslevel=GZIP_COMPRESSLEVEL)
+    return open(fixture_file, "wb")
+
+
+async def fetch_and_save_raw(client, endpoint, params, fixture_file):
+    """
+    Save response body of endpoint to fixture file without parsing it.
+
+    Used for huge responses (stations_list is more than 100MB) to avoid parsing
+    them into Python objects and serializing back with indentation.
+    The fixture is saved as compact JSON, exactly as returned by API.
+    """
+    response = await client.get_response(endpoint, params=params)
+    response.raise_for_status()
+    with open_fixture(fixture_file) as file:
+        file.write(response.content)
 
-def fetch_and_save(client, endpoint, params=None, base_fixtures_path="tests/fixtures", force_rewrite=False, show_mock=True):
-    """Fetch data from API endpoint and save as fixture file."""
+
+async def fetch_and_save(client, endpoint, params=None, base_fixtures_path="tests/fixtures", force_rewrite=False, compress=False):
+    """Fetch data from API endpoint and save as fixture file (gzipped if compress is True)."""
     fixture_file = f"{base_fixtures_path}/{endpoint}_result.json"
+    if compress:
+        fixture_file += ".gz"
     
-    params = client._prepare_params(params)
-    del params['apikey']
-    from urllib.parse import urlencode
-    query_string = urlencode(params, doseq=True)
     api_endpoint = client._build_url(endpoint)
-    full_url = f"{api_endpoint}?{query_string}"
     
     if os.path.exists(fixture_file) and not force_rewrite:
+        # Query string is built only for this log line, client.get() encodes params itself
+        full_url = f"{api_endpoint}?{urlencode(params or {}, doseq=True)}"
         logging.info(f"ℹ️ Fixture for {endpoint} already exists: {fixture_file}. Source: {full_url}")
+    elif endpoint in RAW_ENDPOINTS:
+        await fetch_and_save_raw(client, endpoint, params, fixture_file)
+        logging.info(f"✓ Saved fixture for {endpoint}: {fixture_file}")
     else:
-        result = client.get(endpoint, params=params)
-        with open(fixture_file, "w") as file:
-            json.dump(result, file, indent=4)
+        result = await client.get(endpoint, params=params)
+        with open_fixture(fixture_file) as file:
+            # Compressed fixtures are not meant to be read by humans, so they are compact
+            file.write(json_dumps(result, indent=not fixture_file.endswith(".gz")))
         logging.info(f"✓ Saved fixture for {endpoint}: {fixture_file}")
 
     return (api_endpoint, fixture_file)
 
 
+async def fetch_all(api_key, requests, cache_path, base_fixtures_path="tests/fixtures", force_rewrite=False, compress=False):
+    """
+    Fetch and save fixtures for all requests concurrently.
+
+    Requests are independent, so total time is close to the slowest request
+    instead of sum of all of them. Returns list of (api_endpoint, fixture_file)
+    in the order of requests.
+    """
+    # Single client (and connection pool) is reused for all requests and closed at the end
+    async with AsyncYaraspClient(
+        cache_storage=hishel.AsyncFileStorage(base_path=cache_path)
+    ) as client:
+        # Set API key explicitly (since api_key has init=False in dataclass)
+        client.api_key = api_key
+        return await asyncio.gather(
+            *(
+                fetch_and_save(
+                    client,
+                    request["endpoint"],
+                    params=request["params"],
+                    base_fixtures_path=base_fixtures_path,
+                    force_rewrite=force_rewrite,
+                    compress=compress,
+                )
+                for request in requests
+            )
+        )
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate fixtures for API methods")
     parser.add_argument("--force-rewrite", action="store_true", help="Overwrite existing fixtures")
+    parser.add_argument("--gzip", action="store_true", help="Save fixtures as compact gzipped JSON (*.json.gz)")
     parser.add_argument("--gen-mock", action="store_true", help="Generate and output mock code for httpx_mock to console")
     args = parser.parse_args()
     
@@ -105,44 +169,28 @@ if __name__ == "__main__":
     base_fixtures_path = "tests/fixtures"
     os.makedirs(base_fixtures_path, exist_ok=True)
 
-    # Create client with explicit cache storage and set API key explicitly (since api_key has init=False in dataclass)
-    client = YaraspClient(cache_storage=hishel.FileStorage(base_path="tests/.cache/hishel"))
-    client.api_key = api_key
+    # Cache directory is resolved and created once, so it is not checked on every listing
+    cache_path = Path(DEFAULT_CACHE_DIR)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    cache_files_before = list_cache_files(cache_path)
 
-    requests = REQUESTS
+    results = asyncio.run(
+        fetch_all(api_key, REQUESTS, cache_path, base_fixtures_path=base_fixtures_path, force_rewrite=args.force_rewrite, compress=args.gzip)
+    )
+
+    # Requests run concurrently, so cache files are counted once for all of them
+    cache_files_after = list_cache_files(cache_path)
+    new_cache_files = cache_files_after - cache_files_before
+    if new_cache_files:
+        logging.info(f"Generated {len(new_cache_files)} cache file(s)")
+    elif cache_files_after:
+        logging.info(f"Using existing cache (total cache files: {len(cache_files_after)})")
 
     if args.gen_mock:
-        mock_code = []
-    
-    # Get cache directory from client if available
-    cache_dir = DEFAULT_CACHE_DIR
-    if hasattr(client, 'cache_storage') and client.cache_storage:
-        # Try to get the actual cache directory from hishel FileStorage
-        if hasattr(client.cache_storage, 'base_path'):
-            cache_dir = str(client.cache_storage.base_path)
-        elif hasattr(client.cache_storage, '_base_path'):
-            cache_dir = str(client.cache_storage._base_path)
-    
-    for request in requests:
-        endpoint = request["endpoint"]
-        # Count cache files before request
-        cache_count_before = count_cache_files(cache_dir)
-        
-        (full_url, fixture_file) = fetch_and_save(client, endpoint, params=request["params"], force_rewrite=args.force_rewrite)
-        
-        # Count cache files after request
-        cache_count_after = count_cache_files(cache_dir)
-        cache_files_generated = cache_count_after - cache_count_before
-        
-        if cache_files_generated > 0:
-            logging.info(f"Generated {cache_files_generated} cache file(s) for {endpoint} request")
-        elif cache_count_after > 0:
-            logging.info(f"Using existing cache for {endpoint} request (total cache files: {cache_count_after})")
-        
-        if args.gen_mock:
-            mock_code.append(f"httpx_mock.add_response(url=\"{full_url}\", json=load_mock_json(\"{fixture_file}\"))")
-        
-    if args.gen_mock:
+        mock_code = [
+            f"httpx_mock.add_response(url=\"{full_url}\", json=load_mock_json(\"{fixture_file}\"))"
+            for (full_url, fixture_file) in results
+        ]
         print("\n")
         print("## API mock code: ")
         print("\n".join(mock_code))
@@ -5,61 +5,127 @@ This module contains helper functions, classes, and constants used by
 YaraspClient and AsyncYaraspClient classes.
 """
 
+import functools
+import inspect
 import json
 import logging
-import math
+import os
+import re
 import sqlite3
+import threading
+import time
 from datetime import date
 from typing import Union
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
+import httpcore
 
-def format_size(size_in_units):
-    """Formats data size in human-readable format."""
-    units = ["B", "KB", "MB"]
-    index = 0
-    while size_in_units >= 1024 and index < len(units) - 1:
-        size_in_units /= 1024.0
-        index += 1
-    if index == 2 and size_in_units > 300:
-        logging.warning(
-            "Response is suspiciously big size, it's recommended to enable verbose mode and check manually that the use of this module corresponds to the desired behavior"
-        )
-    return f"{round(size_in_units)}{units[index]}"
+try:
+    from hishel._utils import generate_key
+except ImportError:  # hishel is checked when http client is created
+    generate_key = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used without it
+    orjson = None
+
+
+def json_loads(data):
+    """Deserialize JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def human_readable_size(size_bytes):
+def json_dumps(obj, indent=False):
+    """Serialize object to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def human_readable_size(size_bytes, ndigits=2):
     """Converts size in bytes to human-readable format (KB, MB, GB)."""
     if size_bytes == 0:
         return "0B"
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    size = round(size_bytes / p, 2)
-    return f"{size}{size_names[i]}"
+    # Every unit is 2**10 times bigger than previous one
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    size = round(size_bytes / (1 << (i * 10)), ndigits)
+    return f"{size}{_SIZE_UNITS[i]}"
+
+
+def format_size(size_bytes):
+    """Formats response size in human-readable format, warning about huge responses."""
+    if size_bytes > 300 * 1024 * 1024:
+        logging.warning(
+            "Response is suspiciously big size, it's recommended to enable verbose mode and check manually that the use of this module corresponds to the desired behavior"
+        )
+    return human_readable_size(size_bytes, ndigits=None)
 
 
 class JSONUsageCounter:
     """
     API key usage counter stored in a JSON file.
+
+    Counter is kept in memory and written to disk atomically at most once per
+    flush_interval seconds; pending changes are written by close().
     """
 
-    def __init__(self, file_path):
+    __slots__ = (
+        "file_path",
+        "flush_interval",
+        "data",
+        "_dirty",
+        "_last_flush",
+        "_today_date",
+        "_today_key",
+        "_last_date_check",
+    )
+
+    # How often today's date is re-read from the system clock, in seconds
+    DATE_CHECK_INTERVAL = 60.0
+
+    def __init__(self, file_path, flush_interval=1.0):
         self.file_path = file_path
+        self.flush_interval = flush_interval
+        self._dirty = False
+        # First increment is always written immediately
+        self._last_flush = float("-inf")
         self._load()
 
     def _load(self):
         try:
-            with open(self.file_path, "r") as f:
-                self.data = json.load(f)
+            with open(self.file_path, "rb") as f:
+                self.data = json_loads(f.read())
         except FileNotFoundError:
             self.data = {}
+        self._today_date = date.today()
+        self._today_key = self._today_date.isoformat()
+        self._last_date_check = time.monotonic()
 
     def _save(self):
-        with open(self.file_path, "w") as f:
-            json.dump(self.data, f)
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(self.data))
+        os.replace(tmp_path, self.file_path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
 
     def _get_today_key(self):
-        return date.today().isoformat()
+        now = time.monotonic()
+        if now - self._last_date_check > self.DATE_CHECK_INTERVAL:
+            self._last_date_check = now
+            today = date.today()
+            if today != self._today_date:
+                self._today_date = today
+                self._today_key = today.isoformat()
+        return self._today_key
 
     def get_count(self):
         return self.data.get(self._get_today_key(), 0)
@@ -67,9 +133,22 @@ class JSONUsageCounter:
     def increment(self):
         key = self._get_today_key()
         self.data[key] = self.data.get(key, 0) + 1
-        self._save()
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._save()
         return self.data[key]
 
+    def close(self):
+        """Write pending counter changes to disk."""
+        if self._dirty:
+            self._save()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
 
 class RedisUsageCounter:
     """
@@ -117,6 +196,7 @@ class SQLiteUsageCounter:
     API key usage counter stored in SQLite database.
 
     Stores usage data in table 'apikey_usage' with fields: key, date, counter.
+    One connection in WAL mode is kept open until close().
     """
 
     def __init__(self, db_path, apikey):
@@ -129,25 +209,26 @@ class SQLiteUsageCounter:
         """
         self.db_path = db_path
         self.apikey = apikey
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._init_table()
 
     def _init_table(self):
         """Initialize database table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS apikey_usage (
-                    key TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    counter INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (key, date)
-                )
-                """
+        # WAL lets readers work while counter is written, NORMAL sync is safe in WAL mode
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS apikey_usage (
+                key TEXT NOT NULL,
+                date TEXT NOT NULL,
+                counter INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (key, date)
             )
-            conn.commit()
-        finally:
-            conn.close()
+            """
+        )
+        self._conn.commit()
 
     def _get_today(self):
         """Get today's date as ISO format string."""
@@ -157,51 +238,38 @@ class SQLiteUsageCounter:
         """Get current count for today."""
         if not self.apikey:
             return 0
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT counter FROM apikey_usage WHERE key = ? AND date = ?",
                 (self.apikey, self._get_today()),
-            )
-            row = cursor.fetchone()
-            return row[0] if row else 0
-        finally:
-            conn.close()
+            ).fetchone()
+        return row[0] if row else 0
 
     def increment(self):
         """Increment counter and return new value."""
         if not self.apikey:
             return 0
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Try to update existing record
-            conn.execute(
+        today = self._get_today()
+        with self._lock, self._conn:
+            # Insert record of the day or increment existing one (SQLite >= 3.24)
+            self._conn.execute(
                 """
-                UPDATE apikey_usage
-                SET counter = counter + 1
-                WHERE key = ? AND date = ?
+                INSERT INTO apikey_usage (key, date, counter)
+                VALUES (?, ?, 1)
+                ON CONFLICT (key, date) DO UPDATE SET counter = counter + 1
                 """,
-                (self.apikey, self._get_today()),
+                (self.apikey, today),
             )
-            # If no rows were updated, insert new record
-            if conn.total_changes == 0:
-                conn.execute(
-                    """
-                    INSERT INTO apikey_usage (key, date, counter)
-                    VALUES (?, ?, 1)
-                    """,
-                    (self.apikey, self._get_today()),
-                )
-            conn.commit()
             # Return updated count
-            cursor = conn.execute(
+            row = self._conn.execute(
                 "SELECT counter FROM apikey_usage WHERE key = ? AND date = ?",
-                (self.apikey, self._get_today()),
-            )
-            row = cursor.fetchone()
-            return row[0] if row else 1
-        finally:
-            conn.close()
+                (self.apikey, today),
+            ).fetchone()
+        return row[0] if row else 1
+
+    def close(self):
+        """Close database connection."""
+        self._conn.close()
 
 
 CacheStorageType = Union[
@@ -214,231 +282,170 @@ CacheStorageType = Union[
 ]
 
 
-def _create_safe_storage_wrapper(storage):
+@functools.lru_cache(maxsize=64)
+def _build_endpoint_url(base_url, endpoint):
+    """Return URL of API endpoint with trailing slash (memoized, endpoints are few)."""
+    return f"{base_url}/{endpoint.lstrip('/').rstrip('/')}/"
+
+
+# Matches apikey query parameter together with its leading separator
+_APIKEY_RE = re.compile(r"([?&])apikey=[^&#]*(&?)", re.IGNORECASE)
+
+
+def _url_to_str(url):
+    """Return URL as string; str() of httpcore.URL is its repr, not the URL itself."""
+    if isinstance(url, httpcore.URL):
+        return bytes(url).decode("ascii")
+    return str(url)
+
+
+# Matches non-empty apikey query parameter
+_APIKEY_VALUE_RE = re.compile(r"[?&]apikey=[^&#]")
+
+
+def _url_has_apikey(url):
+    """Return True if URL (string or httpx/httpcore URL object) has non-empty apikey."""
+    return _APIKEY_VALUE_RE.search(_url_to_str(url)) is not None
+
+
+def _clean_url_from_apikey(url):
+    """Remove apikey parameter from URL string (or httpx/httpcore URL object)."""
+    return _APIKEY_RE.sub(
+        lambda m: m.group(1) if m.group(2) else "", _url_to_str(url)
+    ).rstrip("?&")
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonicalize_url(url_str):
     """
-    Create a wrapper class that inherits from storage's class to pass isinstance checks.
+    Return URL used for cache key, which is url_str without apikey (memoized).
 
-    This allows the wrapper to be used where BaseStorage is expected by hishel.
+    url_str is str() of httpcore.URL passed by hishel to key generator. The
+    transformation must stay exactly the same: keys of already cached responses
+    depend on it.
     """
-    import hishel
+    parsed_url = urlparse(url_str)
+    query_params = [
+        (k, v) for k, v in parse_qsl(parsed_url.query) if k.lower() != "apikey"
+    ]
+    return urlunparse(parsed_url._replace(query=urlencode(query_params)))
 
-    # Inherit from storage's class so isinstance checks pass
-    # storage.__class__ is either FileStorage, SQLiteStorage, etc., which all inherit from BaseStorage
-    class SafeStorageWrapper(storage.__class__):
-        """
-        Wrapper over cache storage that removes apikey from request URL before storing.
 
-        This prevents API keys from being saved in cache files, improving security.
-        The wrapper intercepts store() calls and cleans the URL from apikey parameter
-        before passing the request to the underlying storage.
-        """
+@functools.lru_cache(maxsize=1024)
+def _get_cache_key(url_str):
+    """
+    Return cache key of GET request without body for url_str (memoized).
 
-        def __init__(self, wrapped_storage):
-            """Initialize wrapper with underlying storage."""
-            self._wrapped_storage = wrapped_storage
-            # Call super().__init__() to properly initialize the base class
-            # BaseStorage accepts optional serializer and ttl parameters
-            super().__init__(None, None)
-            # Copy all attributes from wrapped storage to maintain compatibility
-            for attr in dir(wrapped_storage):
-                if not attr.startswith("_") and not callable(
-                    getattr(wrapped_storage, attr, None)
-                ):
-                    try:
-                        setattr(self, attr, getattr(wrapped_storage, attr))
-                    except (AttributeError, TypeError):
-                        pass
-
-        def _clean_url_from_apikey(self, url_str):
-            """Remove apikey parameter from URL string."""
-            from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-            parsed = urlparse(str(url_str))
-            query_params = [
-                (k, v) for k, v in parse_qsl(parsed.query) if k.lower() != "apikey"
-            ]
-            new_query = urlencode(query_params)
-            cleaned_url = urlunparse(
-                (
-                    parsed.scheme,
-                    parsed.netloc,
-                    parsed.path,
-                    parsed.params,
-                    new_query,
-                    parsed.fragment,
-                )
-            )
-            return cleaned_url
-
-        def _create_clean_request(self, request):
-            """Create a new request object with URL cleaned from apikey."""
-            import httpcore
-
-            if not hasattr(request, "url") or not request.url:
-                return request
-
-            cleaned_url = self._clean_url_from_apikey(request.url)
-
-            # Create new request with cleaned URL
-            # Preserve all other attributes
-            try:
-                clean_request = httpcore.Request(
-                    method=request.method,
-                    url=cleaned_url,
-                    headers=dict(request.headers)
-                    if hasattr(request, "headers")
-                    else {},
-                    content=getattr(request, "stream", None),
-                    extensions=getattr(request, "extensions", {}),
-                )
-                return clean_request
-            except Exception:
-                # If we can't create clean request, return original
-                # This shouldn't happen, but better safe than sorry
-                return request
+    Same as hishel._utils.generate_key() for request with canonicalized URL, so
+    repeated requests skip both URL parsing and hashing.
+    """
+    return generate_key(httpcore.Request("GET", _canonicalize_url(url_str)), b"")
 
-        def store(self, key, response, request, metadata=None):
-            """
-            Store request in cache after removing apikey from URL.
 
-            Args:
-                key: Cache key
-                response: HTTP response object
-                request: HTTP request object
-                metadata: Cache metadata (optional)
+def _create_clean_request(request):
+    """Create a new request object with URL cleaned from apikey."""
+    if not hasattr(request, "url") or not request.url:
+        return request
 
-            Returns:
-                Result from underlying storage.store()
-            """
-            clean_request = self._create_clean_request(request)
-            return self._wrapped_storage.store(key, response, clean_request, metadata)
+    url_str = _url_to_str(request.url)
+    if "apikey=" not in url_str.lower():
+        # Nothing to clean, stored request is the original one
+        return request
 
-        def retrieve(self, key):
-            """Retrieve cached response by key."""
-            return self._wrapped_storage.retrieve(key)
+    cleaned_url = _clean_url_from_apikey(url_str)
 
-        def delete(self, key):
-            """Delete cached response by key."""
-            return self._wrapped_storage.delete(key)
+    # Create new request with cleaned URL, other attributes are shared with original
+    return httpcore.Request(
+        method=request.method,
+        url=cleaned_url,
+        headers=request.headers,
+        content=request.stream,
+        extensions=request.extensions,
+    )
 
-        def __getattr__(self, name):
-            """Forward all other attribute access to underlying storage."""
-            return getattr(self._wrapped_storage, name)
 
-    return SafeStorageWrapper(storage)
+# Methods implemented by wrappers themselves
+_WRAPPER_OVERRIDES = frozenset({"store", "update_metadata", "retrieve", "delete"})
 
 
-def _create_async_safe_storage_wrapper(storage):
+class _SafeStorageWrapperMixin:
     """
-    Create an async wrapper class that inherits from storage's class to pass isinstance checks.
+    Common part of sync and async wrappers over cache storage.
 
-    This allows the wrapper to be used where AsyncBaseStorage is expected by hishel.
+    Wrappers remove apikey from request URL before storing, which prevents API keys
+    from being saved in cache files. store() calls are intercepted and the URL is
+    cleaned before passing the request to the underlying storage.
     """
-    import hishel
 
-    # Inherit from storage's class so isinstance checks pass
-    # storage.__class__ is either AsyncFileStorage, AsyncSQLiteStorage, etc., which all inherit from AsyncBaseStorage
-    class AsyncSafeStorageWrapper(storage.__class__):
-        """
-        Async wrapper over cache storage that removes apikey from request URL before storing.
+    def __init__(self, wrapped_storage):
+        """Initialize wrapper with underlying storage."""
+        # Share the whole state of wrapped storage instead of initializing base class,
+        # so inherited code and private attributes see the same objects
+        self.__dict__.update(vars(wrapped_storage))
+        self._wrapped_storage = wrapped_storage
+        # Bind public methods of wrapped storage once instead of forwarding them on every call
+        for name, method in inspect.getmembers(wrapped_storage, inspect.ismethod):
+            if not name.startswith("_") and name not in _WRAPPER_OVERRIDES:
+                setattr(self, name, method)
 
-        This prevents API keys from being saved in cache files, improving security.
-        The wrapper intercepts store() calls and cleans the URL from apikey parameter
-        before passing the request to the underlying storage.
-        """
 
-        def __init__(self, wrapped_storage):
-            """Initialize wrapper with underlying storage."""
-            self._wrapped_storage = wrapped_storage
-            # Call super().__init__() to properly initialize the base class
-            # AsyncBaseStorage accepts optional serializer and ttl parameters
-            super().__init__(None, None)
-            # Copy all attributes from wrapped storage to maintain compatibility
-            for attr in dir(wrapped_storage):
-                if not attr.startswith("_") and not callable(
-                    getattr(wrapped_storage, attr, None)
-                ):
-                    try:
-                        setattr(self, attr, getattr(wrapped_storage, attr))
-                    except (AttributeError, TypeError):
-                        pass
-
-        def _clean_url_from_apikey(self, url_str):
-            """Remove apikey parameter from URL string."""
-            from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-            parsed = urlparse(str(url_str))
-            query_params = [
-                (k, v) for k, v in parse_qsl(parsed.query) if k.lower() != "apikey"
-            ]
-            new_query = urlencode(query_params)
-            cleaned_url = urlunparse(
-                (
-                    parsed.scheme,
-                    parsed.netloc,
-                    parsed.path,
-                    parsed.params,
-                    new_query,
-                    parsed.fragment,
+@functools.lru_cache(maxsize=None)
+def _make_safe_storage_wrapper_cls(base_cls, is_async):
+    """
+    Create (once per storage class) a wrapper class that inherits from base_cls.
+
+    Inheriting from storage's class (FileStorage, AsyncSQLiteStorage, etc.) lets the
+    wrapper pass isinstance checks where (Async)BaseStorage is expected by hishel.
+    """
+    if is_async:
+
+        class AsyncSafeStorageWrapper(_SafeStorageWrapperMixin, base_cls):
+            async def store(self, key, response, request, metadata=None):
+                """Store request in cache after removing apikey from URL."""
+                return await self._wrapped_storage.store(
+                    key, response, _create_clean_request(request), metadata
                 )
-            )
-            return cleaned_url
-
-        def _create_clean_request(self, request):
-            """Create a new request object with URL cleaned from apikey."""
-            import httpcore
-
-            if not hasattr(request, "url") or not request.url:
-                return request
-
-            cleaned_url = self._clean_url_from_apikey(request.url)
-
-            # Create new request with cleaned URL
-            # Preserve all other attributes
-            try:
-                clean_request = httpcore.Request(
-                    method=request.method,
-                    url=cleaned_url,
-                    headers=dict(request.headers)
-                    if hasattr(request, "headers")
-                    else {},
-                    content=getattr(request, "stream", None),
-                    extensions=getattr(request, "extensions", {}),
+
+            async def update_metadata(self, key, response, request, metadata):
+                """Update stored metadata after removing apikey from URL."""
+                return await self._wrapped_storage.update_metadata(
+                    key, response, _create_clean_request(request), metadata
                 )
-                return clean_request
-            except Exception:
-                # If we can't create clean request, return original
-                # This shouldn't happen, but better safe than sorry
-                return request
 
-        async def store(self, key, response, request, metadata=None):
-            """
-            Store request in cache after removing apikey from URL.
+            async def retrieve(self, key):
+                """Retrieve cached response by key."""
+                return await self._wrapped_storage.retrieve(key)
 
-            Args:
-                key: Cache key
-                response: HTTP response object
-                request: HTTP request object
-                metadata: Cache metadata (optional)
+            async def delete(self, key):
+                """Delete cached response by key."""
+                return await self._wrapped_storage.delete(key)
 
-            Returns:
-                Result from underlying storage.store()
-            """
-            clean_request = self._create_clean_request(request)
-            return await self._wrapped_storage.store(
-                key, response, clean_request, metadata
+        return AsyncSafeStorageWrapper
+
+    class SafeStorageWrapper(_SafeStorageWrapperMixin, base_cls):
+        def store(self, key, response, request, metadata=None):
+            """Store request in cache after removing apikey from URL."""
+            return self._wrapped_storage.store(
+                key, response, _create_clean_request(request), metadata
+            )
+
+        def update_metadata(self, key, response, request, metadata):
+            """Update stored metadata after removing apikey from URL."""
+            return self._wrapped_storage.update_metadata(
+                key, response, _create_clean_request(request), metadata
             )
 
-        async def retrieve(self, key):
+        def retrieve(self, key):
             """Retrieve cached response by key."""
-            return await self._wrapped_storage.retrieve(key)
+            return self._wrapped_storage.retrieve(key)
 
-        async def delete(self, key):
+        def delete(self, key):
             """Delete cached response by key."""
-            return await self._wrapped_storage.delete(key)
+            return self._wrapped_storage.delete(key)
+
+    return SafeStorageWrapper
 
-        def __getattr__(self, name):
-            """Forward all other attribute access to underlying storage."""
-            return getattr(self._wrapped_storage, name)
 
-    return AsyncSafeStorageWrapper(storage)
+def _create_safe_storage_wrapper(storage, is_async=False):
+    """Wrap cache storage so that apikey is removed from request URLs before storing."""
+    return _make_safe_storage_wrapper_cls(storage.__class__, is_async)(storage)
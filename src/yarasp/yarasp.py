@@ -21,14 +21,28 @@ Environment variables:
     YARASP_API_DAILY_LIMIT  – daily request limit (default: 500)
     YARASP_SAFE_MODE        – safe mode (enabled by default)
     YARASP_VERBOSE          – verbose logging (disabled by default)
+    YARASP_REDIS_URL        – Redis URL for counter_backend="redis" without redis_client
 """
 
+import asyncio
+import functools
+import itertools
+from collections import OrderedDict
+from types import MappingProxyType
 import os
+import sys
 import httpx
 import logging
 from typing import Any, Optional, Set
 from dataclasses import dataclass, field
 
+import httpcore
+
+try:
+    import hishel
+except ImportError:  # error is raised by _init_http_client when cache is enabled
+    hishel = None
+
 
 class CacheMissError(Exception):
     """Raised when cache_only=True and requested data is not in cache."""
@@ -41,11 +55,17 @@ from .utils import (
     RedisUsageCounter,
     SQLiteUsageCounter,
     CacheStorageType,
+    _build_endpoint_url,
+    _canonicalize_url,
     _create_safe_storage_wrapper,
-    _create_async_safe_storage_wrapper,
+    _get_cache_key,
+    _url_has_apikey,
     format_size,
+    json_loads,
 )
 
+logger = logging.getLogger(__name__)
+
 # Reading environment variables
 YARASP_API_KEY = os.environ.get("YARASP_API_KEY")
 
@@ -60,11 +80,175 @@ YARASP_SAFE_MODE = _yarasp_safe_mode.lower() not in ["0", "false"]
 _yarasp_verbose = os.environ.get("YARASP_VERBOSE", "0")
 YARASP_VERBOSE = _yarasp_verbose.lower() in ["1", "true", "yes"]
 
+# httpx default pool size; idle connections are kept longer than httpx's 5 seconds,
+# so they are reused between pages and calls to the single API host
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+
+###############################################################################
+# Usage counter factories
+###############################################################################
+def _sqlite_counter_path(client):
+    # Use counter_storage_path as SQLite database path if it looks like one, or default
+    path = client.counter_storage_path
+    return path if path.endswith((".db", ".sqlite")) else "yarasp_counter.db"
+
+
+def _make_json_counter(client, storage):
+    return JSONUsageCounter(client.counter_storage_path)
+
+
+def _make_sqlite_counter(client, storage):
+    return SQLiteUsageCounter(_sqlite_counter_path(client), client.api_key)
+
+
+def _make_redis_counter(client, storage):
+    # RedisStorage stores client as _client (private attribute),
+    # fallback is redis_client parameter
+    redis_client = getattr(storage, "_client", None)
+    if redis_client is None:
+        redis_client = getattr(storage, "client", None)
+    if redis_client is None:
+        redis_client = client.redis_client
+    if redis_client is None:
+        raise ValueError(
+            "Cannot determine redis_client from RedisStorage. Please provide redis_client parameter."
+        )
+    return RedisUsageCounter(redis_client, client.api_key)
+
+
+# Counter factories for explicitly selected counter_backend
+_COUNTER_BACKENDS = {"redis": _make_redis_counter, "sqlite": _make_sqlite_counter}
+
+# Counter factories selected by cache storage type when counter_backend is "json"
+_COUNTER_FACTORIES = (
+    {hishel.RedisStorage: _make_redis_counter, hishel.SQLiteStorage: _make_sqlite_counter}
+    if hishel is not None
+    else {}
+)
+
+
+def _get_storage_counter_factory(storage):
+    """Return usage counter factory for cache storage (subclasses are matched too)."""
+    for cls in type(storage).__mro__:
+        factory = _COUNTER_FACTORIES.get(cls)
+        if factory is not None:
+            return factory
+    return _make_json_counter
+
+
+def _lower_key(key):
+    """Lowercase string param key for case-insensitive matching, keep other keys."""
+    return key.lower() if isinstance(key, str) else key
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context():
+    """Return SSL context shared by all clients (loading CA certificates takes most of client creation time)."""
+    return httpx.create_ssl_context()
+
+
+def _make_page_url(url, params):
+    """
+    Return function building URL of page by its offset.
+
+    Shared params (including limit) are encoded once, while the URL stays the same
+    as httpx builds from url and params, so cache keys of pages don't change.
+    """
+    if next(reversed(params.keys())) != "offset":
+        # offset was passed by caller, so it is not the last parameter
+        return lambda offset: str(httpx.URL(url, params={**params, "offset": offset}))
+    prefix = str(
+        httpx.URL(url, params={k: v for k, v in params.items() if k != "offset"})
+    )
+    separator = "&" if "?" in prefix else "?"
+    return lambda offset: f"{prefix}{separator}offset={offset}"
+
+
+###############################################################################
+# Endpoints
+###############################################################################
+# Endpoint methods of clients: (name, auto_paginate, result_key)
+_ENDPOINTS = (
+    ("search", True, "segments"),
+    ("schedule", True, "schedule"),
+    ("nearest_stations", True, "stations"),
+    ("thread", False, None),
+    ("nearest_settlement", False, None),
+    ("carrier", False, None),
+    ("stations_list", False, None),
+    ("copyright", False, None),
+)
+
+_ENDPOINTS_CONFIG = MappingProxyType(
+    {name: (auto_paginate, result_key) for name, auto_paginate, result_key in _ENDPOINTS}
+)
+
+
+def _install_endpoints(cls):
+    """Add endpoint methods (search, schedule, etc.) to client class."""
+    # partialmethod binds endpoint settings once and calls get() directly,
+    # they may still be overridden by keyword arguments
+    for name, auto_paginate, result_key in _ENDPOINTS:
+        setattr(
+            cls,
+            name,
+            functools.partialmethod(
+                cls.get, name, auto_paginate=auto_paginate, result_key=result_key
+            ),
+        )
+
+
+###############################################################################
+# Cache controller
+###############################################################################
+# Status codes of responses saved in cache (404 is also cached to avoid repeating
+# requests of missing objects)
+_CACHEABLE_STATUS_CODES = [*range(200, 207), *range(300, 309), 404]
+
+# Request extensions of every API call: responses are taken from cache without
+# revalidation (read-only, httpx copies extensions into each request)
+_FORCE_CACHE_EXTENSIONS = MappingProxyType({"force_cache": True})
+
+
+def _custom_key_generator(request: "httpcore.Request", body: bytes = b"") -> str:
+    # modified hishel._utils.generate_key function
+    # httpcore.Request always keeps method as bytes
+    if request.method == b"GET":
+        if not body:
+            return _get_cache_key(str(request.url))
+        request = httpcore.Request(
+            method=request.method,
+            url=_canonicalize_url(str(request.url)),
+            headers=request.headers,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+    cache_key = hishel._utils.generate_key(request, body)
+    return cache_key
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cache_controller():
+    """Return cache controller shared by all clients (it keeps no per-client state)."""
+    return hishel.Controller(
+        key_generator=_custom_key_generator,
+        cache_private=False,
+        force_cache=True,
+        cacheable_status_codes=_CACHEABLE_STATUS_CODES,
+    )
+
 
 ###############################################################################
 # Common base class
 ###############################################################################
-@dataclass
+# Instances have no __dict__ where slots are supported by dataclasses (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class _YaraspClientBase:
     base_url: str = "https://api.rasp.yandex.net/v3.0"
     ignore_params: Set[str] = field(default_factory=lambda: {"apikey"})
@@ -78,108 +262,67 @@ class _YaraspClientBase:
     cache_enabled: bool = True
     cache_only: bool = False
     cache_storage: Optional["CacheStorageType"] = None
+    pool_limits: Optional[httpx.Limits] = None
+    memory_cache_size: int = 0
+    max_page_concurrency: int = 8
     last_response_from_cache: bool = field(init=False, default=None)
+    _memory_cache: OrderedDict = field(init=False, default_factory=OrderedDict, repr=False)
+    _ignore_params: frozenset = field(init=False, default=frozenset(), repr=False)
+    http_client: Any = field(init=False, default=None, repr=False)
+    usage_counter: Any = field(init=False, default=None, repr=False)
     api_key: str = field(
         init=False,
         default_factory=lambda: os.environ.get("YARASP_API_KEY") or YARASP_API_KEY,
         repr=False,
     )
-    _in_pagination: bool = field(init=False, default=False)
 
     # print("Self anfter init: ", self)
 
+    # Overridden by AsyncYaraspClient to create async HTTP client and cache storage
+    _async_mode = False
+
     def __post_init__(self):
-        self._init_http_client()
+        # Parameter names are compared case-insensitively, as apikey in cache keys
+        self._ignore_params = frozenset(k.lower() for k in self.ignore_params)
+        if self.verbose:
+            # Once per client instead of every logged response
+            logging.basicConfig(level=logging.INFO)
+        self._init_http_client(async_mode=self._async_mode)
 
         # Auto-select counter backend:
         # - Use RedisUsageCounter if counter_backend == "redis" OR cache_storage is RedisStorage
         # - Use SQLiteUsageCounter if counter_backend == "sqlite" OR cache_storage is SQLiteStorage
         # - Otherwise use JSONUsageCounter
-        use_redis_counter = False
-        use_sqlite_counter = False
-        redis_client_for_counter = None
-        sqlite_db_path = None
-
-        if self.counter_backend == "redis":
-            use_redis_counter = True
-            if self.redis_client is None:
+        if self.counter_backend == "redis" and self.redis_client is None:
+            redis_url = os.environ.get("YARASP_REDIS_URL")
+            if not redis_url:
                 raise ValueError(
                     "redis_client must be provided when counter_backend='redis'"
                 )
-            redis_client_for_counter = self.redis_client
-        elif self.counter_backend == "sqlite":
-            use_sqlite_counter = True
-            # Use counter_storage_path as SQLite database path, or default
-            sqlite_db_path = (
-                self.counter_storage_path
-                if self.counter_storage_path.endswith(".db")
-                or self.counter_storage_path.endswith(".sqlite")
-                else "yarasp_counter.db"
-            )
+            import redis
+
+            self.redis_client = redis.from_url(redis_url)
+
+        factory = _COUNTER_BACKENDS.get(self.counter_backend)
+        if factory is not None:
+            self.usage_counter = factory(self, None)
         else:
-            # Check if cache_storage is RedisStorage or SQLiteStorage (may be wrapped)
-            try:
-                import hishel
-
-                # Get the actual storage (unwrap if needed)
-                actual_storage = self.cache_storage
-                if hasattr(self.cache_storage, "_wrapped_storage"):
-                    # Storage is wrapped, get the actual storage
-                    actual_storage = self.cache_storage._wrapped_storage
-
-                # Check if actual storage is RedisStorage
-                if isinstance(actual_storage, hishel.RedisStorage):
-                    use_redis_counter = True
-                    # Try to get redis_client from RedisStorage
-                    # RedisStorage stores client as _client (private attribute)
-                    if hasattr(actual_storage, "_client"):
-                        redis_client_for_counter = actual_storage._client
-                    elif hasattr(actual_storage, "client"):
-                        redis_client_for_counter = actual_storage.client
-                    else:
-                        # Fallback: try to get from redis_client parameter
-                        redis_client_for_counter = self.redis_client
-
-                    if redis_client_for_counter is None:
-                        raise ValueError(
-                            "Cannot determine redis_client from RedisStorage. Please provide redis_client parameter."
-                        )
-                # Check if actual storage is SQLiteStorage
-                elif isinstance(actual_storage, hishel.SQLiteStorage):
-                    use_sqlite_counter = True
-                    # Use counter_storage_path if it's a .db or .sqlite file, otherwise use default
-                    if self.counter_storage_path.endswith(
-                        ".db"
-                    ) or self.counter_storage_path.endswith(".sqlite"):
-                        sqlite_db_path = self.counter_storage_path
-                    else:
-                        sqlite_db_path = "yarasp_counter.db"
-            except ImportError:
-                pass
-
-        if use_redis_counter:
-            if redis_client_for_counter is None:
-                raise ValueError("redis_client is required for RedisUsageCounter")
-            self.usage_counter = RedisUsageCounter(
-                redis_client_for_counter, self.api_key
+            # Get the actual storage (unwrap if needed)
+            actual_storage = getattr(
+                self.cache_storage, "_wrapped_storage", self.cache_storage
             )
-        elif use_sqlite_counter:
-            if sqlite_db_path is None:
-                sqlite_db_path = "yarasp_counter.db"
-            self.usage_counter = SQLiteUsageCounter(sqlite_db_path, self.api_key)
-        else:
-            self.usage_counter = JSONUsageCounter(self.counter_storage_path)
+            factory = _get_storage_counter_factory(actual_storage)
+            self.usage_counter = factory(self, actual_storage)
 
     def _init_http_client(self, async_mode=False):
         """Initialize HTTP client with caching support."""
         ua_header = {"User-Agent": self.user_agent}
+        limits = self.pool_limits or DEFAULT_POOL_LIMITS
 
         # default storage for files: .cache/hishel
 
         if self.cache_enabled:
-            try:
-                import hishel
-            except ImportError:
+            if hishel is None:
                 raise ImportError(
                     "hishel module is required for caching. Install it: pip install hishel"
                 )
@@ -194,8 +337,8 @@ class _YaraspClientBase:
                     # self.cache_storage = hishel.AsyncSQLiteStorage()
                     self.cache_storage = hishel.AsyncFileStorage()
                 # Wrap storage to remove apikey from URLs before storing
-                self.cache_storage = _create_async_safe_storage_wrapper(
-                    self.cache_storage
+                self.cache_storage = _create_safe_storage_wrapper(
+                    self.cache_storage, is_async=True
                 )
             else:
                 if not isinstance(self.cache_storage, hishel.BaseStorage):
@@ -204,92 +347,39 @@ class _YaraspClientBase:
                 # Wrap storage to remove apikey from URLs before storing
                 self.cache_storage = _create_safe_storage_wrapper(self.cache_storage)
 
-            def custom_key_generator(
-                request: "httpcore.Request", body: bytes = b""
-            ) -> str:
-                # modified hishel._utils.generate_key function
-                if isinstance(request.method, bytes):  # Ensure method is a string
-                    method = request.method.decode()
-                else:
-                    method = request.method  # Already a string
-
-                if method == "GET":
-                    from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-                    parsed_url = urlparse(str(request.url))
-                    query_params = [
-                        (k, v)
-                        for k, v in parse_qsl(parsed_url.query)
-                        if k.lower() != "apikey"
-                    ]
-                    new_query = urlencode(query_params)
-                    new_url = urlunparse(
-                        (
-                            parsed_url.scheme,
-                            parsed_url.netloc,
-                            parsed_url.path,
-                            parsed_url.params,
-                            new_query,
-                            parsed_url.fragment,
-                        )
-                    )
-
-                    request = httpcore.Request(
-                        method=request.method,
-                        url=new_url,
-                        headers=request.headers,
-                        content=request.stream,
-                        extensions=request.extensions,
-                    )
-                cache_key = hishel._utils.generate_key(request, body)
-                return cache_key
-
-            import httpcore
-
-            controller = hishel.Controller(
-                key_generator=custom_key_generator,
-                cache_private=False,
-                force_cache=True,
-                cacheable_status_codes=[
-                    200,
-                    201,
-                    202,
-                    203,
-                    204,
-                    205,
-                    206,
-                    300,
-                    301,
-                    302,
-                    303,
-                    304,
-                    305,
-                    306,
-                    307,
-                    308,
-                    404
-                ],
-            )
+            controller = _get_cache_controller()
             client_cls = hishel.AsyncCacheClient if async_mode else hishel.CacheClient
             self.http_client = client_cls(
-                storage=self.cache_storage, controller=controller, headers=ua_header
+                storage=self.cache_storage,
+                controller=controller,
+                headers=ua_header,
+                limits=limits,
+                verify=_get_ssl_context(),
             )
         else:
             httpx_client_cls = httpx.AsyncClient if async_mode else httpx.Client
-            self.http_client = httpx_client_cls(headers=ua_header)
+            self.http_client = httpx_client_cls(
+                headers=ua_header, limits=limits, verify=_get_ssl_context()
+            )
 
     def _prepare_params(self, params):
-        if params is None:
-            params = {}
+        # New dict is built, so caller's params (which may be read-only mapping) are not changed
+        if not params:
+            return {"apikey": self.api_key}
+        if self._ignore_params.isdisjoint(map(_lower_key, params)):
+            # Usual case: plain copy without per-key filtering
+            params = dict(params)
         else:
-            for key in list(params.keys()):
-                if key in self.ignore_params:
-                    params.pop(key)
+            params = {
+                k: v
+                for k, v in params.items()
+                if _lower_key(k) not in self._ignore_params
+            }
         params["apikey"] = self.api_key
         return params
 
     def _build_url(self, endpoint):
-        return f"{self.base_url}/{endpoint.lstrip('/').rstrip('/')}/"
+        return _build_endpoint_url(self.base_url, endpoint)
 
     def _generate_cache_key(self, url, params):
         """
@@ -302,56 +392,49 @@ class _YaraspClientBase:
         Returns:
             str: Cache key
         """
-        import hishel
-        import httpcore
-        from urllib.parse import urlencode
-
-        # Build URL with params (excluding apikey)
-        clean_params = {k: v for k, v in params.items() if k.lower() != "apikey"}
-        query_string = urlencode(clean_params) if clean_params else ""
-        full_url = f"{url}?{query_string}" if query_string else url
-
-        # Create request object
-        request = httpcore.Request(
-            method="GET",
-            url=full_url,
-            headers={},
+        # Build httpcore URL the same way as httpx transport does for the real
+        # request (apikey included), then apply the same logic as _custom_key_generator
+        request_url = httpx.URL(url, params=params)
+        core_url = httpcore.URL(
+            scheme=request_url.raw_scheme,
+            host=request_url.raw_host,
+            port=request_url.port,
+            target=request_url.raw_path,
         )
+        return _get_cache_key(str(core_url))
+
+    def _memory_cache_key(self, url, params):
+        """Return key of in-memory cache for request, or None if it is disabled."""
+        if self.memory_cache_size > 0 and self.cache_enabled:
+            return self._generate_cache_key(url, params)
+        return None
+
+    def _memory_cache_get(self, key):
+        """Return parsed response from in-memory cache (least recently used is evicted first)."""
+        data = self._memory_cache.get(key)
+        if data is not None:
+            self._memory_cache.move_to_end(key)
+            self.last_response_from_cache = True
+        return data
+
+    def _memory_cache_put(self, key, response, data):
+        """Save parsed successful response to in-memory cache."""
+        if response.status_code != 200:
+            return
+        self._memory_cache[key] = data
+        if len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def _cache_only_headers(self):
+        """
+        Return request headers for cache_only mode.
 
-        # Generate cache key using the same logic as custom_key_generator
-        if isinstance(request.method, bytes):
-            method = request.method.decode()
-        else:
-            method = request.method
-
-        if method == "GET":
-            from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-            parsed_url = urlparse(str(request.url))
-            query_params = [
-                (k, v) for k, v in parse_qsl(parsed_url.query) if k.lower() != "apikey"
-            ]
-            new_query = urlencode(query_params)
-            new_url = urlunparse(
-                (
-                    parsed_url.scheme,
-                    parsed_url.netloc,
-                    parsed_url.path,
-                    parsed_url.params,
-                    new_query,
-                    parsed_url.fragment,
-                )
-            )
-
-            request = httpcore.Request(
-                method=request.method,
-                url=new_url,
-                headers=request.headers,
-                content=request.stream,
-                extensions=request.extensions,
-            )
-        cache_key = hishel._utils.generate_key(request, b"")
-        return cache_key
+        With "Cache-Control: only-if-cached" hishel answers 504 right after its own
+        cache lookup instead of making API request, so no extra lookup is needed.
+        """
+        if self.cache_only and self.cache_enabled:
+            return {"Cache-Control": "only-if-cached"}
+        return None
 
     def _check_cache_exists(self, url, params):
         """
@@ -412,18 +495,24 @@ class _YaraspClientBase:
             return False
 
     def _log_response_verbose(self, response):
-        """Logs HTTP response with extended information."""
-        if self.verbose:
-            size_str = format_size(len(response.content))
-            cached = "cached" if self.last_response_from_cache else ""
-            logging.basicConfig(level=logging.INFO)
-            logging.info(
-                f" {response.request.method.upper()} {response.url} - Status: {response.status_code}, Data Length: ~{size_str} {cached}".strip()
-            )
+        """Logs HTTP response with extended information (called only in verbose mode)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "%s %s - Status: %s, Data Length: ~%s%s",
+            response.request.method,
+            response.url,
+            response.status_code,
+            format_size(len(response.content)),
+            " cached" if self.last_response_from_cache else "",
+        )
 
     def _check_daily_limit(self):
+        if not self.safe_mode:
+            # Limit isn't enforced, so counter storage (file, SQLite, Redis) isn't read
+            return
         current_count = self.usage_counter.get_count()
-        if self.safe_mode and current_count >= self.daily_limit:
+        if current_count >= self.daily_limit:
             logging.warning(
                 "Daily API request limit exceeded: %d/%d",
                 current_count,
@@ -436,6 +525,17 @@ class _YaraspClientBase:
     def _increment_usage(self):
         self.usage_counter.increment()
 
+    def _close_usage_counter(self):
+        # Only file-based counter buffers changes in memory
+        if hasattr(self.usage_counter, "close"):
+            self.usage_counter.close()
+
+    def _has_api_key(self):
+        """Check that client API key is set (None, empty and whitespace-only are not)."""
+        if isinstance(self.api_key, str):
+            return bool(self.api_key.strip())
+        return bool(self.api_key)
+
     def _has_valid_apikey(self, response):
         """Check if request has a valid (non-empty) API key.
 
@@ -446,33 +546,14 @@ class _YaraspClientBase:
             bool: True if API key is present and non-empty, False otherwise
         """
         # First check self.api_key (the key used in _prepare_params)
-        # Handle None, empty string, and whitespace-only strings
-        if not self.api_key or (
-            isinstance(self.api_key, str) and not self.api_key.strip()
-        ):
+        if not self._has_api_key():
             return False
 
         # Also check the actual request URL to catch cases where empty apikey was passed
         # This handles the case: GET ...?apikey=&...
-        try:
-            from urllib.parse import urlparse, parse_qsl
-
-            request_url = (
-                str(response.request.url)
-                if hasattr(response, "request") and hasattr(response.request, "url")
-                else str(response.url)
-            )
-            parsed_url = urlparse(request_url)
-            query_params = dict(parse_qsl(parsed_url.query))
-            apikey_in_url = query_params.get("apikey", "")
-            # If apikey is in URL but empty, it's invalid
-            if apikey_in_url == "":
-                return False
-        except Exception:
-            # If we can't parse URL, fall back to self.api_key check
-            pass
-
-        return True
+        request = getattr(response, "request", None)
+        request_url = getattr(request, "url", None) or response.url
+        return _url_has_apikey(request_url)
 
     def _log_and_check_limits(self, response, skip_counter=False):
         """Request logging and limit checking.
@@ -484,53 +565,32 @@ class _YaraspClientBase:
         # Safely get from_cache flag - it may not be set if request was mocked
         # Default to None if not set, which we'll treat as "unknown" (likely mocked)
         self.last_response_from_cache = response.extensions.get("from_cache")
-        self._log_response_verbose(response)
+        if self.verbose:
+            self._log_response_verbose(response)
         # Only increment counter if response is explicitly NOT from cache
         # (from_cache is False, meaning it was a real API request)
         # If from_cache is None, it's likely a mocked request, so don't count it
         # If from_cache is True, it's from cache, so don't count it
-        # skip_counter is used internally to track pagination requests separately
-        # Also skip if we're in pagination mode (counter will be handled in _get_paginated_results)
+        # skip_counter is used for pagination requests (counter is handled once
+        # in _get_paginated_results/_aget_paginated_results)
         # Only increment counter if request has a valid (non-empty) API key
-        if (
-            not skip_counter
-            and not self._in_pagination
-            and self.last_response_from_cache is False
-        ):
+        if not skip_counter and self.last_response_from_cache is False:
             if self._has_valid_apikey(response):
                 self._check_daily_limit()
                 self._increment_usage()
 
-    # async def _parse_json_response(self, response, async_mode):
-    #     """JSON response handler for synchronous and asynchronous modes."""
-    #     try:
-    #         return await response.json() if async_mode else response.json()
-    #     except Exception:
-    #         raw_text = await response.text() if async_mode else response.text
-    #         return {"error": "Failed to decode JSON", "raw": raw_text}
-
-    # async def _parse_json_response(self, response, is_async=False):
-    #     """Common JSON response handler for synchronous and asynchronous calls."""
-    #     try:
-    #         if is_async:
-    #             return await response.json()
-    #         return response.json()
-    #     except Exception:
-    #         if is_async:
-    #             return {"error": "Failed to decode JSON", "raw": await response.text()}
-    #         return {"error": "Failed to decode JSON", "raw": response.text()}
-
     def _parse_json_response_sync(self, response):
         """Synchronous JSON response handler."""
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             return {"error": "Failed to decode JSON", "raw": response.text}
 
     async def _parse_json_response_async(self, response):
         """Asynchronous JSON response handler."""
         try:
-            return await response.json()
+            # Body of response returned by AsyncClient.get() is already read
+            return json_loads(response.content)
         except Exception:
             return {"error": "Failed to decode JSON", "raw": response.text}
 
@@ -544,118 +604,197 @@ class _YaraspClientBase:
     # },
 
     def _get_paginated_results(
-        self, get_page, params, result_key=None, async_mode=False, limit=100
+        self, get_page, url, params, result_key=None, limit=100
     ):
-        """Hybrid method for pagination (supports both synchronous and asynchronous calls)."""
+        """Sync pagination: aggregated items of result_key (or list of pages)."""
+        if not callable(get_page):
+            raise TypeError(f"get_page is not a function, it has type {type(get_page)}")
+
+        return list(
+            self._iter_paginated_results(
+                get_page, url, params, result_key=result_key, limit=limit
+            )
+        )
 
+    async def _aget_paginated_results(
+        self, get_page, url, params, result_key=None, limit=100
+    ):
+        """
+        Async pagination: pages after the first one are requested concurrently,
+        results are aggregated in offset order.
+        """
         if not callable(get_page):
             raise TypeError(f"get_page is not a function, it has type {type(get_page)}")
 
-        # TODO: create method to check is page in cache
-        # if not YARASP_API_KEY:
-        #    raise RuntimeError("Environment variable YARASP_API_KEY is not set!")
-
-        async def _async_mode():
-            # Set pagination flag to skip counter increments in _log_and_check_limits
-            self._in_pagination = True
-            aggregated = []
-            params["limit"] = limit
-            params["offset"] = 0
-            # Track if any request was a real API call (not from cache)
-            any_real_request = False
-            data = await get_page(params)
-            # Check if first request was real (not from cache)
-            if self.last_response_from_cache is False:
-                any_real_request = True
-
-            if result_key:
-                aggregated.extend(data.get(result_key, []))
-            else:
-                aggregated.append(data)
+        params["limit"] = limit
+        params["offset"] = 0
+        page_url = _make_page_url(url, params)
+        # Track if any request was a real API call (not from cache)
+        any_real_request = False
+        completed = False
+        try:
+            data = await get_page(page_url(0), skip_counter=True)
+            any_real_request = self.last_response_from_cache is False
 
             pagination = data.get("pagination", {})
             total = pagination.get("total", 0)
             offset = pagination.get("offset", 0)
 
-            while offset + limit < total:
-                offset += limit
-                params["offset"] = offset
-                page_data = await get_page(params)
+            if offset + limit >= total:
+                # Single page (the usual case): nothing else to request
+                pages = ()
+            else:
+                # Pages waiting for free connection of the pool could fail with PoolTimeout
+                semaphore = asyncio.Semaphore(max(1, self.max_page_concurrency))
+
+                async def get_page_with_cache_flag(page_offset):
+                    nonlocal any_real_request
+                    async with semaphore:
+                        page_data = await get_page(
+                            page_url(page_offset), skip_counter=True
+                        )
+                        # get_page sets the flag right before returning, without
+                        # switching to other tasks, so it still belongs to this page
+                        if self.last_response_from_cache is False:
+                            any_real_request = True
+                        return page_data
+
+                # Offsets of all remaining pages are known after the first page,
+                # so they are requested concurrently (at most max_page_concurrency at once)
+                pages = await asyncio.gather(
+                    *(
+                        get_page_with_cache_flag(page_offset)
+                        for page_offset in range(offset + limit, total, limit)
+                    )
+                )
+            completed = True
+        finally:
+            self._count_paginated_request(any_real_request, check_limit=completed)
+
+        if not result_key:
+            return [data, *pages]
+
+        # All pages are received, so result list is built in a single pass
+        return list(
+            itertools.chain.from_iterable(
+                page_data.get(result_key) or () for page_data in (data, *pages)
+            )
+        )
+
+    def _count_paginated_request(self, any_real_request, check_limit=True):
+        """
+        Increment usage counter once for all pages of paginated request.
+
+        check_limit is False when pagination was interrupted (error or stopped
+        iteration): real requests are still counted, but the daily limit check
+        doesn't replace the original exception.
+        """
+        # Only increment counter once if any request was real and has valid API key
+        if any_real_request and self._has_api_key():
+            if check_limit:
+                self._check_daily_limit()
+            self._increment_usage()
+        # Set last_response_from_cache based on whether all were from cache
+        self.last_response_from_cache = not any_real_request
+
+    def _iter_paginated_results(
+        self, get_page, url, params, result_key=None, limit=100
+    ):
+        """
+        Generator of paginated results: items of result_key (or whole pages if it
+        is None) are yielded as soon as their page is received.
+
+        Usage counter is updated when iteration is finished or stopped; the daily
+        limit is checked only when all pages were received.
+        """
+        params["limit"] = limit
+        params["offset"] = 0
+        page_url = _make_page_url(url, params)
+        # Track if any request was a real API call (not from cache)
+        any_real_request = False
+        completed = False
+        try:
+            offset, total = 0, None
+            while total is None or offset < total:
+                data = get_page(page_url(offset), skip_counter=True)
                 # Check if this request was real (not from cache)
                 if self.last_response_from_cache is False:
                     any_real_request = True
 
                 if result_key:
-                    aggregated.extend(page_data.get(result_key, []))
+                    yield from data.get(result_key) or ()
                 else:
-                    aggregated.append(page_data)
-
-            # Only increment counter once if any request was real and has valid API key
-            if (
-                any_real_request
-                and self.api_key
-                and (isinstance(self.api_key, str) and self.api_key.strip())
-            ):
-                self._check_daily_limit()
-                self._increment_usage()
-            # Set last_response_from_cache based on whether all were from cache
-            self.last_response_from_cache = not any_real_request
-            # Reset pagination flag
-            self._in_pagination = False
-
-            return aggregated
-
-        def _sync_mode():
-            # Set pagination flag to skip counter increments in _log_and_check_limits
-            self._in_pagination = True
-            aggregated = []
-            params["limit"] = limit
-            params["offset"] = 0
-            # Track if any request was a real API call (not from cache)
-            any_real_request = False
-            data = get_page(params)
-            # Check if first request was real (not from cache)
-            if self.last_response_from_cache is False:
-                any_real_request = True
-
-            if result_key:
-                aggregated.extend(data.get(result_key, []))
-            else:
-                aggregated.append(data)
-
-            pagination = data.get("pagination", {})
-            total = pagination.get("total", 0)
-            offset = pagination.get("offset", 0)
+                    yield data
 
-            while offset + limit < total:
+                if total is None:
+                    # Total doesn't change between pages, so it is read only once
+                    pagination = data.get("pagination", {})
+                    total = pagination.get("total", 0)
+                    offset = pagination.get("offset", offset)
                 offset += limit
-                params["offset"] = offset
-                page_data = get_page(params)
+            completed = True
+        finally:
+            self._count_paginated_request(any_real_request, check_limit=completed)
+
+    async def _aiter_paginated_results(
+        self, get_page, url, params, result_key=None, limit=100
+    ):
+        """
+        Async version of _iter_paginated_results: while items of a page are
+        consumed, the next page is already being requested.
+        """
+        params["limit"] = limit
+        params["offset"] = 0
+        page_url = _make_page_url(url, params)
+
+        async def get_page_with_cache_flag(page_offset):
+            page_data = await get_page(page_url(page_offset), skip_counter=True)
+            # get_page sets the flag right before returning, so it belongs to this page
+            return page_data, self.last_response_from_cache
+
+        # Track if any request was a real API call (not from cache)
+        any_real_request = False
+        completed = False
+        next_page = None
+        try:
+            offset, total = 0, None
+            data, from_cache = await get_page_with_cache_flag(offset)
+            while True:
                 # Check if this request was real (not from cache)
-                if self.last_response_from_cache is False:
+                if from_cache is False:
                     any_real_request = True
 
+                if total is None:
+                    # Total doesn't change between pages, so it is read only once
+                    pagination = data.get("pagination", {})
+                    total = pagination.get("total", 0)
+                    offset = pagination.get("offset", offset)
+                offset += limit
+                if offset < total:
+                    next_page = asyncio.ensure_future(get_page_with_cache_flag(offset))
+
                 if result_key:
-                    aggregated.extend(page_data.get(result_key, []))
+                    for item in data.get(result_key) or ():
+                        yield item
                 else:
-                    aggregated.append(page_data)
-
-            # Only increment counter once if any request was real and has valid API key
-            if (
-                any_real_request
-                and self.api_key
-                and (isinstance(self.api_key, str) and self.api_key.strip())
-            ):
-                self._check_daily_limit()
-                self._increment_usage()
-            # Set last_response_from_cache based on whether all were from cache
-            self.last_response_from_cache = not any_real_request
-            # Reset pagination flag
-            self._in_pagination = False
-
-            return aggregated
-
-        return _async_mode() if async_mode else _sync_mode()
+                    yield data
+
+                if next_page is None:
+                    break
+                data, from_cache = await next_page
+                next_page = None
+            completed = True
+        finally:
+            if next_page is not None:
+                # Iteration was stopped before prefetched page was used
+                if next_page.done() and not next_page.cancelled():
+                    if next_page.exception() is None:
+                        _, from_cache = next_page.result()
+                        if from_cache is False:
+                            any_real_request = True
+                else:
+                    next_page.cancel()
+            self._count_paginated_request(any_real_request, check_limit=completed)
 
     def is_from_cache(self) -> bool:
         """
@@ -670,68 +809,120 @@ class _YaraspClientBase:
         Get endpoints configuration.
 
         Returns:
-            dict: Dictionary mapping endpoint names to (auto_paginate, result_key) tuples.
-        """
-        return {
-            "search": (True, "segments"),
-            "schedule": (True, "schedule"),
-            "nearest_stations": (True, "stations"),
-            "thread": (False, None),
-            "nearest_settlement": (False, None),
-            "carrier": (False, None),
-            "stations_list": (False, None),
-            "copyright": (False, None),
-        }
-
-    @classmethod
-    def _create_wrapped_methods(cls):
-        endpoints = cls._get_endpoints_config()
-
-        for name, (auto_paginate, result_key) in endpoints.items():
-            setattr(
-                cls,
-                name,
-                lambda self,
-                params=None,
-                ep=name,
-                ap=auto_paginate,
-                rk=result_key: self.get(ep, params, auto_paginate=ap, result_key=rk),
-            )
+            Mapping: Read-only mapping of endpoint names to (auto_paginate, result_key) tuples.
+        """
+        return _ENDPOINTS_CONFIG
 
 
 ###############################################################################
 # Synchronous client
 ###############################################################################
 class YaraspClient(_YaraspClientBase):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def get(self, endpoint, params=None, auto_paginate=False, result_key=None):
-        params = self._prepare_params(params)
-        url = self._build_url(endpoint)
+    def __enter__(self) -> "YaraspClient":
+        return self
 
-        def get_page(p):
-            response = self.http_client.get(
-                url, params=p, extensions={"force_cache": True}
-            )
-            self._log_and_check_limits(response)
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close underlying HTTP client and write pending usage counter changes."""
+        self.http_client.close()
+        self._close_usage_counter()
+
+    def _request_page(self, endpoint, url, params=None, skip_counter=False):
+        """Request page (taken from cache when possible), check limits and cache_only."""
+        response = self.http_client.get(
+            url,
+            params=params,
+            headers=self._cache_only_headers(),
+            extensions=_FORCE_CACHE_EXTENSIONS,
+        )
+        if response.extensions.get("from_cache") is True and not self.verbose:
+            # Cache hit: there is nothing to log or count
+            self.last_response_from_cache = True
+        else:
+            self._log_and_check_limits(response, skip_counter=skip_counter)
 
             # If cache_only is enabled, verify response came from cache
-            # This check happens after the request, so we can rely on last_response_from_cache
+            # (cache miss is answered by hishel with 504 which is not from cache)
             if self.cache_only and not self.last_response_from_cache:
                 raise CacheMissError(
                     f"Data not found in cache for endpoint '{endpoint}'. "
                     "Set cache_only=False to allow API requests."
                 )
+        return response
+
+    def _get_page(self, endpoint, url, params=None, skip_counter=False):
+        memory_key = self._memory_cache_key(url, params)
+        if memory_key is not None:
+            data = self._memory_cache_get(memory_key)
+            if data is not None:
+                return data
 
-            return self._parse_json_response_sync(response)
+        response = self._request_page(endpoint, url, params, skip_counter)
+        data = self._parse_json_response_sync(response)
+        if memory_key is not None:
+            self._memory_cache_put(memory_key, response, data)
+        return data
+
+    def get(self, endpoint, params=None, auto_paginate=False, result_key=None):
+        params = self._prepare_params(params)
+        url = self._build_url(endpoint)
+        get_page = functools.partial(self._get_page, endpoint)
 
         if auto_paginate:
             return self._get_paginated_results(
-                get_page, params, result_key=result_key, async_mode=False
+                get_page, url, params, result_key=result_key
             )
 
-        return get_page(params)
+        return get_page(url, params)
+
+    def get_response(self, endpoint, params=None):
+        """
+        Get HTTP response of endpoint without parsing its JSON body.
+
+        Response is taken from cache when possible, usage counter, daily limit and
+        cache_only are handled the same way as in get(). Useful for huge responses
+        (e.g. stations_list) that are saved as is.
+
+        Args:
+            endpoint: API endpoint name (e.g., 'stations_list')
+            params: Request parameters (without apikey, it will be added automatically)
+
+        Returns:
+            httpx.Response: Response with already read body
+        """
+        return self._request_page(
+            endpoint, self._build_url(endpoint), self._prepare_params(params)
+        )
+
+    def iter_paginated(self, endpoint, params=None, result_key=None):
+        """
+        Iterate over results of paginated endpoint, requesting pages on demand.
+
+        Unlike get() with auto_paginate=True, results are not aggregated in a list,
+        so only one page is kept in memory.
+
+        Args:
+            endpoint: API endpoint name (e.g., 'search', 'schedule', 'nearest_stations')
+            params: Request parameters (without apikey, it will be added automatically)
+            result_key: Key of items in page, by default taken from endpoint configuration
+
+        Yields:
+            Items of result_key from every page (whole pages if there is no result_key)
+        """
+        if result_key is None:
+            result_key = _ENDPOINTS_CONFIG.get(endpoint, (False, None))[1]
+        params = self._prepare_params(params)
+        get_page = functools.partial(self._get_page, endpoint)
+        return self._iter_paginated_results(
+            get_page, self._build_url(endpoint), params, result_key=result_key
+        )
 
     def has_cache(self, endpoint: str, params: Optional[dict] = None) -> bool:
         """
@@ -758,36 +949,99 @@ class YaraspClient(_YaraspClientBase):
 # Asynchronous client
 ###############################################################################
 class AsyncYaraspClient(_YaraspClientBase):
+    __slots__ = ()
+
+    _async_mode = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._init_http_client(async_mode=True)
 
-    async def get(self, endpoint, params=None, auto_paginate=False, result_key=None):
-        params = self._prepare_params(params)
-        url = self._build_url(endpoint)
+    async def __aenter__(self) -> "AsyncYaraspClient":
+        return self
 
-        async def get_page(p):
-            response = await self.http_client.get(
-                url, params=p, extensions={"force_cache": True}
-            )
-            self._log_and_check_limits(response)
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close underlying HTTP client and write pending usage counter changes."""
+        await self.http_client.aclose()
+        self._close_usage_counter()
+
+    async def _request_page(self, endpoint, url, params=None, skip_counter=False):
+        """Request page (taken from cache when possible), check limits and cache_only."""
+        response = await self.http_client.get(
+            url,
+            params=params,
+            headers=self._cache_only_headers(),
+            extensions=_FORCE_CACHE_EXTENSIONS,
+        )
+        if response.extensions.get("from_cache") is True and not self.verbose:
+            # Cache hit: there is nothing to log or count
+            self.last_response_from_cache = True
+        else:
+            self._log_and_check_limits(response, skip_counter=skip_counter)
 
             # If cache_only is enabled, verify response came from cache
-            # This check happens after the request, so we can rely on last_response_from_cache
+            # (cache miss is answered by hishel with 504 which is not from cache)
             if self.cache_only and not self.last_response_from_cache:
                 raise CacheMissError(
                     f"Data not found in cache for endpoint '{endpoint}'. "
                     "Set cache_only=False to allow API requests."
                 )
+        return response
+
+    async def _get_page(self, endpoint, url, params=None, skip_counter=False):
+        memory_key = self._memory_cache_key(url, params)
+        if memory_key is not None:
+            data = self._memory_cache_get(memory_key)
+            if data is not None:
+                return data
+
+        response = await self._request_page(endpoint, url, params, skip_counter)
+        data = await self._parse_json_response_async(response)
+        if memory_key is not None:
+            self._memory_cache_put(memory_key, response, data)
+        return data
 
-            return await self._parse_json_response_async(response)
+    async def get(self, endpoint, params=None, auto_paginate=False, result_key=None):
+        params = self._prepare_params(params)
+        url = self._build_url(endpoint)
+        get_page = functools.partial(self._get_page, endpoint)
 
         if auto_paginate:
-            return await self._get_paginated_results(
-                get_page, params, result_key=result_key, async_mode=True
+            return await self._aget_paginated_results(
+                get_page, url, params, result_key=result_key
             )
 
-        return await get_page(params)
+        return await get_page(url, params)
+
+    async def get_response(self, endpoint, params=None):
+        """Async version of YaraspClient.get_response()."""
+        return await self._request_page(
+            endpoint, self._build_url(endpoint), self._prepare_params(params)
+        )
+
+    def aiter_paginated(self, endpoint, params=None, result_key=None):
+        """
+        Asynchronously iterate over results of paginated endpoint (async version).
+
+        Pages are requested one by one on demand, so only one page is kept in memory.
+
+        Args:
+            endpoint: API endpoint name (e.g., 'search', 'schedule', 'nearest_stations')
+            params: Request parameters (without apikey, it will be added automatically)
+            result_key: Key of items in page, by default taken from endpoint configuration
+
+        Yields:
+            Items of result_key from every page (whole pages if there is no result_key)
+        """
+        if result_key is None:
+            result_key = _ENDPOINTS_CONFIG.get(endpoint, (False, None))[1]
+        params = self._prepare_params(params)
+        get_page = functools.partial(self._get_page, endpoint)
+        return self._aiter_paginated_results(
+            get_page, self._build_url(endpoint), params, result_key=result_key
+        )
 
     async def has_cache(self, endpoint: str, params: Optional[dict] = None) -> bool:
         """
@@ -810,5 +1064,5 @@ class AsyncYaraspClient(_YaraspClientBase):
         return await self._check_cache_exists_async(url, params)
 
 
-YaraspClient._create_wrapped_methods()
-AsyncYaraspClient._create_wrapped_methods()
+_install_endpoints(YaraspClient)
+_install_endpoints(AsyncYaraspClient)
@@ -7,6 +7,8 @@ import pytest
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 STATIONS_LIST_FIXTURE = FIXTURES_DIR / "stations_list_result.json"
+# Compact gzipped variant, generated with scripts/gen_fixtures.py --gzip
+STATIONS_LIST_FIXTURE_GZ = FIXTURES_DIR / "stations_list_result.json.gz"
 STATIONS_LIST_S3_URL = "https://tierf15-pub.s3.cloud.ru/fixtures/stations_list_result.json"
 
 
@@ -64,12 +66,12 @@ def pytest_collection_modifyitems(config, items):
 
 def ensure_stations_list_fixture():
     """
-    Checks for stations_list_result.json and downloads it from S3 if necessary.
+    Checks for stations_list_result.json (or its .gz variant) and downloads it from S3 if necessary.
     
     Returns:
         bool: True if file is available, False if file is unavailable
     """
-    if STATIONS_LIST_FIXTURE.exists():
+    if STATIONS_LIST_FIXTURE.exists() or STATIONS_LIST_FIXTURE_GZ.exists():
         return True
     
     # Try to download file from S3
@@ -110,3 +112,36 @@ def stations_list_fixture_available(request):
         return ensure_stations_list_fixture()
     return False
 
+
+
+# Cache with real API responses, generated with scripts/gen_fixtures.py
+HISHEL_CACHE_DIR = "tests/.cache/hishel"
+
+
+@pytest.fixture(scope="session")
+def cache_client():
+    """
+    YaraspClient reading fixture responses from tests/.cache/hishel.
+
+    Created once per session and only when a test requests it, so collection of
+    skipped cache tests doesn't open the storage.
+    """
+    import hishel
+    from yarasp import YaraspClient
+
+    client = YaraspClient(cache_storage=hishel.FileStorage(base_path=HISHEL_CACHE_DIR))
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def cache_only_client():
+    """Same as cache_client, but with cache_only=True (no requests to API)."""
+    import hishel
+    from yarasp import YaraspClient
+
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=HISHEL_CACHE_DIR), cache_only=True
+    )
+    yield client
+    client.close()
@@ -94,4 +94,66 @@ def test_yarasp_client_verbose_override():
     assert client3.verbose is True
     
     client4 = AsyncYaraspClient(verbose=False)
-    assert client4.verbose is False
\ No newline at end of file
+    assert client4.verbose is False
+
+def test_prepare_params_does_not_change_passed_params():
+    from types import MappingProxyType
+
+    client = YaraspClient(cache_enabled=False)
+    client.api_key = "key"
+    params = {"station": "s9600366", "apikey": "other"}
+    assert client._prepare_params(params) == {"station": "s9600366", "apikey": "key"}
+    assert params == {"station": "s9600366", "apikey": "other"}
+    # Read-only mappings (e.g. requests from scripts/fixture_requests.py) are accepted too
+    assert client._prepare_params(MappingProxyType({"uid": "1"})) == {"uid": "1", "apikey": "key"}
+    assert client._prepare_params(None) == {"apikey": "key"}
+
+
+def test_prepare_params_ignores_params_case_insensitively():
+    client = YaraspClient(cache_enabled=False, ignore_params={"apikey", "Debug"})
+    client.api_key = "key"
+    params = {"APIKEY": "other", "debug": "1", "uid": "1"}
+    assert client._prepare_params(params) == {"uid": "1", "apikey": "key"}
+    # Non-string keys are passed as is
+    assert client._prepare_params({1: "a", "APIKEY": "b"}) == {1: "a", "apikey": "key"}
+
+
+def test_pool_limits_passed_to_http_client():
+    import httpx
+    from yarasp.yarasp import DEFAULT_POOL_LIMITS
+
+    assert YaraspClient().pool_limits is None
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+    # Cached client wraps httpx transport with hishel CacheTransport
+    client = YaraspClient(pool_limits=limits)
+    assert client.http_client._transport._transport._pool._max_connections == 5
+    client = AsyncYaraspClient(cache_enabled=False)
+    pool = client.http_client._transport._pool
+    assert pool._max_connections == DEFAULT_POOL_LIMITS.max_connections
+    assert pool._max_keepalive_connections == DEFAULT_POOL_LIMITS.max_keepalive_connections
+    assert pool._keepalive_expiry == DEFAULT_POOL_LIMITS.keepalive_expiry == 30.0
+    # Pool is not smaller than httpx default one
+    assert DEFAULT_POOL_LIMITS.max_connections == 100
+
+
+def test_cache_controller_is_shared():
+    client1 = YaraspClient()
+    client2 = AsyncYaraspClient()
+    assert client1.http_client._transport._controller is client2.http_client._transport._controller
+    assert 404 in client1.http_client._transport._controller._cacheable_status_codes
+
+
+def test_clients_have_no_instance_dict():
+    import sys
+
+    if sys.version_info < (3, 10):
+        pytest.skip("dataclass slots require Python 3.10+")
+    assert not hasattr(YaraspClient(cache_enabled=False), "__dict__")
+    assert not hasattr(AsyncYaraspClient(cache_enabled=False), "__dict__")
+
+
+def test_ssl_context_is_shared():
+    client1 = YaraspClient()
+    client2 = AsyncYaraspClient(cache_enabled=False)
+    ssl_context = client1.http_client._transport._transport._pool._ssl_context
+    assert ssl_context is client2.http_client._transport._pool._ssl_context
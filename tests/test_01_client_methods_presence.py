@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from yarasp import YaraspClient
 
@@ -12,6 +14,12 @@ def test_yarasp_client_methods():
         assert callable(getattr(client, method)), f"Method {method} is not callable"
 
 
+def test_yarasp_client_context_manager():
+    with YaraspClient() as client:
+        assert not client.http_client.is_closed
+    assert client.http_client.is_closed
+
+
 ### ASYNC ###
 
 
@@ -26,3 +34,13 @@ def test_yarasp_client_methods():
     ]:
         assert hasattr(client, method), f"Method {method} is missing in YaraspClient"
         assert callable(getattr(client, method)), f"Method {method} is not callable"
+
+
+def test_async_yarasp_client_context_manager():
+    async def run():
+        async with AsyncYaraspClient() as client:
+            assert not client.http_client.is_closed
+        return client
+
+    client = asyncio.run(run())
+    assert client.http_client.is_closed
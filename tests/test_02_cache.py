@@ -46,10 +46,7 @@ pytestmark = pytest.mark.skipif(
     reason="Cache directory tests/.cache/hishel does not exist or is empty",
 )
 
-client = YaraspClient(cache_storage=hishel.FileStorage(base_path="tests/.cache/hishel"))
-
-
-def test_yarasp_cache():
+def test_yarasp_cache(cache_client):
     """
     Test that all requests are served from cache.
 
@@ -59,8 +56,8 @@ def test_yarasp_cache():
     """
 
     # Test carrier endpoint
-    result = client.get(CARRIER_REQUEST["endpoint"], params=CARRIER_REQUEST["params"])
-    assert client.last_response_from_cache is True
+    result = cache_client.get(CARRIER_REQUEST["endpoint"], params=CARRIER_REQUEST["params"])
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "carrier" in result
     assert isinstance(result["carrier"], dict)
@@ -68,15 +65,15 @@ def test_yarasp_cache():
     assert "codes" in result["carrier"]
 
     # Test search endpoint
-    result = client.get(SEARCH_REQUEST["endpoint"], params=SEARCH_REQUEST["params"])
-    assert client.last_response_from_cache is True
+    result = cache_client.get(SEARCH_REQUEST["endpoint"], params=SEARCH_REQUEST["params"])
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "segments" in result or "search" in result
     assert "pagination" in result
 
     # Test schedule endpoint
-    result = client.get(SCHEDULE_REQUEST["endpoint"], params=SCHEDULE_REQUEST["params"])
-    assert client.last_response_from_cache is True
+    result = cache_client.get(SCHEDULE_REQUEST["endpoint"], params=SCHEDULE_REQUEST["params"])
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "schedule" in result
     assert isinstance(result["schedule"], list)
@@ -84,38 +81,38 @@ def test_yarasp_cache():
         assert isinstance(result["pagination"], dict)
 
     # Test thread endpoint
-    result = client.get(THREAD_REQUEST["endpoint"], params=THREAD_REQUEST["params"])
-    assert client.last_response_from_cache is True
+    result = cache_client.get(THREAD_REQUEST["endpoint"], params=THREAD_REQUEST["params"])
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "thread" in result or "stops" in result
 
     # Test nearest_stations endpoint
-    result = client.get(
+    result = cache_client.get(
         NEAREST_STATIONS_REQUEST["endpoint"], params=NEAREST_STATIONS_REQUEST["params"]
     )
-    assert client.last_response_from_cache is True
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "stations" in result or "pagination" in result
 
     # Test nearest_settlement endpoint
-    result = client.get(
+    result = cache_client.get(
         NEAREST_SETTLEMENT_REQUEST["endpoint"],
         params=NEAREST_SETTLEMENT_REQUEST["params"],
     )
-    assert client.last_response_from_cache is True
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "settlement" in result or "title" in result
 
     # Test copyright endpoint
-    result = client.get(
+    result = cache_client.get(
         COPYRIGHT_REQUEST["endpoint"], params=COPYRIGHT_REQUEST["params"]
     )
-    assert client.last_response_from_cache is True
+    assert cache_client.last_response_from_cache is True
     assert isinstance(result, dict), f"Expected dict, but got {type(result)}"
     assert "copyright" in result or "text" in result
 
 
-def test_all_fixture_requests_from_cache():
+def test_all_fixture_requests_from_cache(cache_client):
     """
     Test that all requests from fixture_requests.REQUESTS are served from cache.
 
@@ -129,8 +126,8 @@ def test_all_fixture_requests_from_cache():
         if endpoint == "stations_list":
             continue
 
-        result = client.get(endpoint, params=params)
-        assert client.last_response_from_cache is True, (
+        result = cache_client.get(endpoint, params=params)
+        assert cache_client.last_response_from_cache is True, (
             f"Request for {endpoint} should be from cache"
         )
         assert isinstance(result, dict), (
@@ -138,25 +135,28 @@ def test_all_fixture_requests_from_cache():
         )
 
 
-def test_cache_only_mode_with_cached_data():
+def test_has_cache_for_all_fixture_requests(cache_client):
+    """Test that has_cache() finds cache entries stored by real requests."""
+    for request in REQUESTS:
+        assert cache_client.has_cache(request["endpoint"], request["params"]) is True, (
+            f"Cache entry for {request['endpoint']} should exist"
+        )
+
+
+def test_cache_only_mode_with_cached_data(cache_only_client):
     """
     Test that cache_only=True works correctly when data is in cache.
 
     This test verifies that cache_only mode allows reading from cache
     and doesn't raise CacheMissError when data exists.
     """
-    cache_client = YaraspClient(
-        cache_storage=hishel.FileStorage(base_path="tests/.cache/hishel"),
-        cache_only=True,
-    )
-
     # This should work because data is in cache
-    result = cache_client.get(
+    result = cache_only_client.get(
         CARRIER_REQUEST["endpoint"], params=CARRIER_REQUEST["params"]
     )
     assert isinstance(result, dict)
     assert "carrier" in result
-    assert cache_client.last_response_from_cache is True
+    assert cache_only_client.last_response_from_cache is True
 
 
 def test_cache_only_mode_without_cached_data():
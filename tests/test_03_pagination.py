@@ -67,7 +67,7 @@ def test_paginated_endpoints():
         if "limit" in params:
             params.pop("limit")
         
-        # Get the method and call it (it will use auto_paginate=True by default from _create_wrapped_methods)
+        # Get the method and call it (it will use auto_paginate=True by default from _install_endpoints)
         method = getattr(client, endpoint_name)
         result = method(params=params)
         
@@ -77,3 +77,265 @@ def test_paginated_endpoints():
         # Note: We don't check cache status here because pagination makes multiple requests
         # (with different offset values), and some of them may not be in cache yet.
         # The important thing is that pagination works and returns a list.
+
+
+def _paginated_response(request):
+    """Mocked API page: 250 segments split into pages by limit/offset."""
+    import httpx
+
+    limit = int(request.url.params.get("limit", 100))
+    offset = int(request.url.params.get("offset", 0))
+    segments = [{"n": n} for n in range(offset, min(offset + limit, 250))]
+    return httpx.Response(
+        200,
+        json={
+            "pagination": {"total": 250, "limit": limit, "offset": offset},
+            "segments": segments,
+        },
+    )
+
+
+def test_paginated_results_are_aggregated_in_order(httpx_mock):
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+    client = YaraspClient(cache_enabled=False)
+    result = client.search(params={"from": "c213", "to": "c2"})
+    assert result == [{"n": n} for n in range(250)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_async_paginated_results_are_aggregated_in_order(httpx_mock):
+    import asyncio
+
+    from yarasp import AsyncYaraspClient
+
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+
+    async def run():
+        async with AsyncYaraspClient(cache_enabled=False) as client:
+            return await client.search(params={"from": "c213", "to": "c2"})
+
+    assert asyncio.run(run()) == [{"n": n} for n in range(250)]
+    offsets = sorted(int(r.url.params["offset"]) for r in httpx_mock.get_requests())
+    assert offsets == [0, 100, 200]
+
+
+def test_single_page_result(httpx_mock):
+    import asyncio
+
+    from yarasp import AsyncYaraspClient
+
+    segments = [{"n": n} for n in range(30)]
+    httpx_mock.add_response(
+        json={
+            "pagination": {"total": 30, "limit": 100, "offset": 0},
+            "segments": segments,
+        },
+        is_reusable=True,
+    )
+    client = YaraspClient(cache_enabled=False)
+    assert client.search(params={"from": "c213", "to": "c2"}) == segments
+
+    async def run():
+        async with AsyncYaraspClient(cache_enabled=False) as async_client:
+            return await async_client.search(params={"from": "c213", "to": "c2"})
+
+    assert asyncio.run(run()) == segments
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_endpoint_method_auto_paginate_override(httpx_mock):
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+    client = YaraspClient(cache_enabled=False)
+    result = client.search(params={"from": "c213", "to": "c2"}, auto_paginate=False)
+    assert result["pagination"]["total"] == 250
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_paginated_request_counted_once(httpx_mock, tmp_path):
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path / "cache"),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.api_key = "key"
+    client.search(params={"from": "c213", "to": "c2"})
+    assert len(httpx_mock.get_requests()) == 3
+    assert client.last_response_from_cache is False
+    assert client.usage_counter.get_count() == 1
+
+
+def _failing_second_page(request):
+    """Mocked API: first page of 250 segments, then connection error."""
+    import httpx
+
+    if request.url.params.get("offset") != "0":
+        raise httpx.ConnectError("Connection lost")
+    return _paginated_response(request)
+
+
+def test_interrupted_pagination_keeps_original_error(httpx_mock, tmp_path):
+    """Daily limit check doesn't replace errors or close() of interrupted pagination."""
+    import asyncio
+
+    import httpx
+
+    from yarasp import AsyncYaraspClient
+
+    httpx_mock.add_callback(_failing_second_page, is_reusable=True)
+
+    def make_client(cls, storage_cls, name):
+        client = cls(
+            cache_storage=storage_cls(base_path=tmp_path / name),
+            counter_storage_path=str(tmp_path / f"{name}.json"),
+            daily_limit=0,
+        )
+        client.api_key = "key"
+        return client
+
+    client = make_client(YaraspClient, hishel.FileStorage, "sync")
+    with pytest.raises(httpx.ConnectError):
+        client.search(params={"from": "c213", "to": "c2"})
+    # Real request of the first page is still counted
+    assert client.usage_counter.get_count() == 1
+
+    items = make_client(YaraspClient, hishel.FileStorage, "iter").iter_paginated(
+        "search", params={"from": "c213", "to": "c2"}
+    )
+    assert next(items) == {"n": 0}
+    items.close()
+
+    async def run():
+        async_client = make_client(AsyncYaraspClient, hishel.AsyncFileStorage, "async")
+        async with async_client:
+            with pytest.raises(httpx.ConnectError):
+                await async_client.search(params={"from": "c213", "to": "c2"})
+            assert async_client.usage_counter.get_count() == 1
+
+            items = async_client.aiter_paginated(
+                "search", params={"from": "c213", "to": "c2"}
+            )
+            assert await items.__anext__() == {"n": 0}
+            await items.aclose()
+
+    asyncio.run(run())
+
+
+def test_completed_pagination_checks_daily_limit(httpx_mock, tmp_path):
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path / "cache"),
+        counter_storage_path=str(tmp_path / "counter.json"),
+        daily_limit=0,
+    )
+    client.api_key = "key"
+    with pytest.raises(RuntimeError, match="Daily API request limit exceeded"):
+        client.search(params={"from": "c213", "to": "c2"})
+
+
+def test_iter_paginated_requests_pages_on_demand(httpx_mock):
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+    client = YaraspClient(cache_enabled=False)
+    items = client.iter_paginated("search", params={"from": "c213", "to": "c2"})
+    assert next(items) == {"n": 0}
+    assert len(httpx_mock.get_requests()) == 1
+    assert list(items) == [{"n": n} for n in range(1, 250)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_aiter_paginated(httpx_mock):
+    import asyncio
+
+    from yarasp import AsyncYaraspClient
+
+    httpx_mock.add_callback(_paginated_response, is_reusable=True)
+
+    async def run():
+        async with AsyncYaraspClient(cache_enabled=False) as client:
+            return [
+                item
+                async for item in client.aiter_paginated(
+                    "search", params={"from": "c213", "to": "c2"}
+                )
+            ]
+
+    assert asyncio.run(run()) == [{"n": n} for n in range(250)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_aiter_paginated_prefetches_next_page(httpx_mock):
+    import asyncio
+
+    from yarasp import AsyncYaraspClient
+
+    async def run():
+        second_page_requested = asyncio.Event()
+
+        async def callback(request):
+            if request.url.params["offset"] == "100":
+                second_page_requested.set()
+            return _paginated_response(request)
+
+        httpx_mock.add_callback(callback, is_reusable=True)
+        async with AsyncYaraspClient(cache_enabled=False) as client:
+            items = client.aiter_paginated("search", params={"from": "c213", "to": "c2"})
+            assert await items.__anext__() == {"n": 0}
+            # Second page is requested while items of the first one are consumed
+            # (timeout only guards against hanging if it is never requested)
+            await asyncio.wait_for(second_page_requested.wait(), timeout=10)
+            await items.aclose()
+
+    asyncio.run(run())
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_async_pagination_concurrency_is_limited(httpx_mock):
+    import asyncio
+
+    import httpx
+
+    from yarasp import AsyncYaraspClient
+
+    running = {"now": 0, "max": 0}
+
+    async def slow_page(request):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        offset = int(request.url.params["offset"])
+        return httpx.Response(
+            200,
+            json={
+                "pagination": {"total": 600, "limit": 100, "offset": offset},
+                "segments": [{"n": offset}],
+            },
+        )
+
+    httpx_mock.add_callback(slow_page, is_reusable=True)
+
+    async def run():
+        async with AsyncYaraspClient(cache_enabled=False, max_page_concurrency=2) as client:
+            return await client.search(params={"from": "c213", "to": "c2"})
+
+    assert asyncio.run(run()) == [{"n": n} for n in range(0, 600, 100)]
+    assert running["max"] == 2
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"from": "c213", "to": "c2", "apikey": "key", "limit": 100, "offset": 0},
+        {"station": "s 9600213", "date": "2024-01-15", "lang": "ru_RU", "offset": 0},
+        # offset passed by caller is not the last parameter
+        {"offset": 0, "from": "c213", "limit": 100},
+    ],
+)
+def test_page_url_is_same_as_httpx_url(params):
+    import httpx
+
+    from yarasp.yarasp import _make_page_url
+
+    url = "https://api.rasp.yandex.net/v3.0/search/"
+    page_url = _make_page_url(url, params)
+    for offset in (0, 100, 1200):
+        assert page_url(offset) == str(httpx.URL(url, params={**params, "offset": offset}))
@@ -209,3 +209,119 @@ def test_counter_not_incremented_from_cache():
         if os.path.exists(counter_file):
             os.unlink(counter_file)
 
+
+
+def test_json_counter_flushed_on_close():
+    """Test that buffered JSON counter changes are written to file on client close."""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        counter_file = os.path.join(tmp_dir, 'counter.json')
+        client = YaraspClient(cache_enabled=False, counter_storage_path=counter_file)
+        client.usage_counter.flush_interval = 3600
+
+        client.usage_counter.increment()  # first increment is written immediately
+        client.usage_counter.increment()
+        with open(counter_file) as f:
+            assert list(json.load(f).values()) == [1]
+
+        client.close()
+        with open(counter_file) as f:
+            assert list(json.load(f).values()) == [2]
+
+
+def test_json_counter_has_no_instance_dict(tmp_path):
+    """Test that JSON counter stores its state in slots."""
+    from yarasp import JSONUsageCounter
+
+    counter = JSONUsageCounter(str(tmp_path / "counter.json"))
+    assert not hasattr(counter, "__dict__")
+    assert counter.increment() == 1
+
+
+def test_counter_backend_selection(tmp_path, monkeypatch):
+    """Test that usage counter backend is selected by counter_backend and cache storage type."""
+    import sqlite3
+
+    import hishel
+    import pytest
+
+    from yarasp import JSONUsageCounter, RedisUsageCounter, SQLiteUsageCounter
+
+    db_path = str(tmp_path / "counter.db")
+    client = YaraspClient(cache_enabled=False, counter_storage_path=str(tmp_path / "c.json"))
+    assert isinstance(client.usage_counter, JSONUsageCounter)
+
+    client = YaraspClient(cache_enabled=False, counter_backend="sqlite", counter_storage_path=db_path)
+    assert isinstance(client.usage_counter, SQLiteUsageCounter)
+    assert client.usage_counter.db_path == db_path
+
+    storage = hishel.SQLiteStorage(connection=sqlite3.connect(":memory:"))
+    client = YaraspClient(cache_storage=storage, counter_storage_path=db_path)
+    assert isinstance(client.usage_counter, SQLiteUsageCounter)
+
+    redis = pytest.importorskip("redis")
+    redis_client = redis.Redis()
+    client = YaraspClient(cache_storage=hishel.RedisStorage(client=redis_client))
+    assert isinstance(client.usage_counter, RedisUsageCounter)
+    assert client.usage_counter.redis_client is redis_client
+
+    monkeypatch.delenv("YARASP_REDIS_URL", raising=False)
+    with pytest.raises(ValueError, match="redis_client must be provided"):
+        YaraspClient(cache_enabled=False, counter_backend="redis")
+
+
+def test_redis_counter_from_url(monkeypatch):
+    """Test that Redis counter client is created from YARASP_REDIS_URL."""
+    import pytest
+
+    from yarasp import RedisUsageCounter
+
+    pytest.importorskip("redis")
+    monkeypatch.setenv("YARASP_REDIS_URL", "redis://localhost:6379/3")
+    client = YaraspClient(cache_enabled=False, counter_backend="redis")
+    assert isinstance(client.usage_counter, RedisUsageCounter)
+    assert client.redis_client.connection_pool.connection_kwargs["db"] == 3
+
+
+def test_sqlite_counter_increment(tmp_path):
+    """Test that SQLite counter keeps one connection in WAL mode and counts across instances."""
+    from yarasp import SQLiteUsageCounter
+
+    db_path = str(tmp_path / "counter.db")
+    counter = SQLiteUsageCounter(db_path, "key")
+    assert counter._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert counter.get_count() == 0
+    assert [counter.increment() for _ in range(3)] == [1, 2, 3]
+    counter.close()
+
+    counter = SQLiteUsageCounter(db_path, "key")
+    assert counter.get_count() == 3
+    assert counter.increment() == 4
+    assert SQLiteUsageCounter(db_path, "other").increment() == 1
+    counter.close()
+
+
+def test_daily_limit_check_reads_counter_only_in_safe_mode(tmp_path, monkeypatch):
+    """Test that usage counter is read for limit check only when safe_mode is enabled."""
+    import pytest
+
+    from yarasp import JSONUsageCounter
+
+    client = YaraspClient(
+        cache_enabled=False,
+        safe_mode=False,
+        daily_limit=1,
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    with monkeypatch.context() as m:
+        m.setattr(JSONUsageCounter, "get_count", None)  # Must not be called
+        client._check_daily_limit()
+
+    client = YaraspClient(
+        cache_enabled=False,
+        daily_limit=1,
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.usage_counter.increment()
+    with pytest.raises(RuntimeError):
+        client._check_daily_limit()
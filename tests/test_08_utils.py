@@ -0,0 +1,254 @@
+"""
+Test helper functions from yarasp.utils.
+"""
+
+import asyncio
+
+import httpcore
+import hishel
+import pytest
+
+from yarasp import AsyncYaraspClient, YaraspClient, utils
+from yarasp.utils import (
+    _build_endpoint_url,
+    _canonicalize_url,
+    _clean_url_from_apikey,
+    _create_clean_request,
+    _get_cache_key,
+    _url_has_apikey,
+    format_size,
+    human_readable_size,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://api.rasp.yandex.net/v3.0/search/?apikey=key&from=s1", "https://api.rasp.yandex.net/v3.0/search/?from=s1"),
+        ("https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=key", "https://api.rasp.yandex.net/v3.0/search/?from=s1"),
+        ("https://api.rasp.yandex.net/v3.0/search/?from=s1&APIKEY=key&to=s2", "https://api.rasp.yandex.net/v3.0/search/?from=s1&to=s2"),
+        ("https://api.rasp.yandex.net/v3.0/copyright/?apikey=key", "https://api.rasp.yandex.net/v3.0/copyright/"),
+        ("https://api.rasp.yandex.net/v3.0/copyright/?apikey=", "https://api.rasp.yandex.net/v3.0/copyright/"),
+        ("https://api.rasp.yandex.net/v3.0/search/?xapikey=1", "https://api.rasp.yandex.net/v3.0/search/?xapikey=1"),
+    ],
+)
+def test_clean_url_from_apikey(url, expected):
+    assert _clean_url_from_apikey(url) == expected
+
+
+def test_clean_url_from_apikey_httpcore_url():
+    url = httpcore.URL("https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=key")
+    assert _clean_url_from_apikey(url) == "https://api.rasp.yandex.net/v3.0/search/?from=s1"
+
+
+def test_create_clean_request():
+    request = httpcore.Request("GET", "https://api.rasp.yandex.net/v3.0/search/?from=s1")
+    assert _create_clean_request(request) is request
+    request = httpcore.Request(
+        "GET", "https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=key"
+    )
+    clean_request = _create_clean_request(request)
+    assert bytes(clean_request.url) == b"https://api.rasp.yandex.net/v3.0/search/?from=s1"
+    assert clean_request.headers == request.headers
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://api.rasp.yandex.net/v3.0/search/?apikey=key&from=s1", True),
+        ("https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=key", True),
+        ("https://api.rasp.yandex.net/v3.0/search/?apikey=&from=s1", False),
+        ("https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=", False),
+        ("https://api.rasp.yandex.net/v3.0/search/?from=s1", False),
+        ("https://api.rasp.yandex.net/v3.0/search/?my_apikey=key", False),
+    ],
+)
+def test_url_has_apikey(url, expected):
+    assert _url_has_apikey(url) is expected
+    assert _url_has_apikey(httpcore.URL(url)) is expected
+
+
+@pytest.mark.parametrize("endpoint", ["search", "/search", "search/", "/search/"])
+def test_build_endpoint_url(endpoint):
+    base_url = "https://api.rasp.yandex.net/v3.0"
+    assert _build_endpoint_url(base_url, endpoint) == f"{base_url}/search/"
+
+
+def test_get_cache_key_matches_hishel_key():
+    url = str(httpcore.URL("https://api.rasp.yandex.net/v3.0/search/?from=s1&apikey=key"))
+    request = httpcore.Request("GET", _canonicalize_url(url))
+    assert _get_cache_key(url) == hishel._utils.generate_key(request, b"")
+    # apikey is not a part of the key
+    assert _get_cache_key(url) == _get_cache_key(url.replace("apikey=key", "apikey=other"))
+
+
+def test_cache_key_is_stable():
+    """Keys of already cached responses must not change, otherwise whole cache is lost."""
+    from yarasp.yarasp import _custom_key_generator
+
+    url = "https://api.rasp.yandex.net/v3.0/search/?from=c213&to=c2&apikey={}&date=2024-01-15"
+    for apikey in ("secret", "other"):
+        request = httpcore.Request("GET", url.format(apikey))
+        assert _custom_key_generator(request, b"") == "62e6c973a1114e6305fb245c7e94922d"
+
+
+@pytest.mark.parametrize(
+    "size_bytes, expected",
+    [
+        (0, "0B"),
+        (1, "1.0B"),
+        (1023, "1023.0B"),
+        (1024, "1.0KB"),
+        (1536, "1.5KB"),
+        (5 * 1024 ** 2, "5.0MB"),
+        (3 * 1024 ** 3, "3.0GB"),
+        (2048 * 1024 ** 4, "2048.0TB"),
+    ],
+)
+def test_human_readable_size(size_bytes, expected):
+    assert human_readable_size(size_bytes) == expected
+
+
+def test_format_size():
+    assert format_size(0) == "0B"
+    assert format_size(1536) == "2KB"
+    assert format_size(10 * 1024 ** 2) == "10MB"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_roundtrip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    data = {"title": "Москва", "codes": {"yandex": "c213"}, "stations": [1, 2.5, None]}
+    assert isinstance(utils.json_dumps(data), bytes)
+    assert utils.json_loads(utils.json_dumps(data)) == data
+    assert utils.json_loads(utils.json_dumps(data, indent=True)) == data
+    assert b"\n" in utils.json_dumps(data, indent=True)
+
+
+def test_parse_json_response():
+    import httpx
+
+    client = YaraspClient(cache_enabled=False)
+    response = httpx.Response(200, content='{"title": "Москва"}'.encode())
+    assert client._parse_json_response_sync(response) == {"title": "Москва"}
+    assert asyncio.run(client._parse_json_response_async(response)) == {"title": "Москва"}
+    response = httpx.Response(200, text="not json")
+    assert client._parse_json_response_sync(response) == {
+        "error": "Failed to decode JSON",
+        "raw": "not json",
+    }
+
+
+def test_live_non_json_response_returns_error_dict(httpx_mock, tmp_path):
+    """Counted live response with non-JSON body is returned as error dict."""
+    html = "<html>Internal Server Error</html>"
+    httpx_mock.add_response(
+        status_code=500, text=html, headers={"Content-Type": "text/html"},
+        is_reusable=True,
+    )
+    expected = {"error": "Failed to decode JSON", "raw": html}
+
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path / "cache"),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.api_key = "key"
+    assert client.copyright() == expected
+    assert client.last_response_from_cache is False
+    assert client.usage_counter.get_count() == 1
+
+    async def run():
+        async with AsyncYaraspClient(
+            cache_storage=hishel.AsyncFileStorage(base_path=tmp_path / "async"),
+            counter_storage_path=str(tmp_path / "async_counter.json"),
+        ) as async_client:
+            async_client.api_key = "key"
+            return await async_client.copyright()
+
+    assert asyncio.run(run()) == expected
+
+
+def test_get_response_returns_unparsed_body(httpx_mock, tmp_path):
+    """get_response() returns raw body and counts live request like get()."""
+    import httpx
+
+    body = b'{"stations": []}'
+    httpx_mock.add_response(content=body, is_reusable=True)
+
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path / "cache"),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.api_key = "key"
+    response = client.get_response("stations_list")
+    assert isinstance(response, httpx.Response)
+    assert response.content == body
+    assert client.usage_counter.get_count() == 1
+    assert client.get_response("stations_list").content == body
+    assert client.last_response_from_cache is True
+    assert client.usage_counter.get_count() == 1
+
+    async def run():
+        async with AsyncYaraspClient(cache_enabled=False) as async_client:
+            return await async_client.get_response("stations_list")
+
+    assert asyncio.run(run()).content == body
+
+
+def test_verbose_response_logging(httpx_mock, caplog):
+    import logging
+
+    httpx_mock.add_response(json={"copyright": {}}, is_reusable=True)
+    with caplog.at_level(logging.INFO, logger="yarasp"):
+        YaraspClient(cache_enabled=False, verbose=True).copyright()
+        YaraspClient(cache_enabled=False, verbose=False).copyright()
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert message.startswith("GET https://api.rasp.yandex.net/v3.0/copyright/")
+    assert message.endswith("Status: 200, Data Length: ~16B")
+
+
+def test_safe_storage_wrapper_does_not_store_apikey(httpx_mock, tmp_path):
+    httpx_mock.add_response(json={"carrier": {}}, is_reusable=True)
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.api_key = "secret-api-key"
+
+    client.carrier({"code": "SU"})
+    assert client.last_response_from_cache is False
+    # Second request is served from cache and updates stored metadata
+    client.carrier({"code": "SU"})
+    assert client.last_response_from_cache is True
+
+    cache_files = [path for path in tmp_path.iterdir() if path.name not in (".gitignore", "counter.json")]
+    assert cache_files
+    for path in cache_files:
+        assert b"secret-api-key" not in path.read_bytes()
+
+
+def test_async_safe_storage_wrapper_does_not_store_apikey(httpx_mock, tmp_path):
+    httpx_mock.add_response(json={"carrier": {}}, is_reusable=True)
+    client = AsyncYaraspClient(
+        cache_storage=hishel.AsyncFileStorage(base_path=tmp_path),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    client.api_key = "secret-api-key"
+
+    async def run():
+        first = await client.carrier({"code": "SU"})
+        first_from_cache = client.last_response_from_cache
+        second = await client.carrier({"code": "SU"})
+        return first, first_from_cache, second, client.last_response_from_cache
+
+    assert asyncio.run(run()) == ({"carrier": {}}, False, {"carrier": {}}, True)
+
+    cache_files = [path for path in tmp_path.iterdir() if path.name not in (".gitignore", "counter.json")]
+    assert cache_files
+    for path in cache_files:
+        assert b"secret-api-key" not in path.read_bytes()
@@ -0,0 +1,63 @@
+"""
+Test caching features that don't depend on fixture cache in tests/.cache/hishel.
+
+All API responses here are mocked with pytest-httpx.
+"""
+
+import asyncio
+
+import hishel
+
+from yarasp import AsyncYaraspClient, YaraspClient
+
+
+def test_memory_cache(httpx_mock, tmp_path):
+    """Test that in-memory cache answers repeated requests without hishel round-trip."""
+    httpx_mock.add_response(json={"carrier": {"code": 1}}, is_reusable=True)
+    storage_path = tmp_path / "cache"
+
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=storage_path),
+        counter_storage_path=str(tmp_path / "counter.json"),
+        memory_cache_size=1,
+    )
+    first = client.carrier(params={"code": 1})
+    assert client.carrier(params={"code": 1}) is first
+    assert client.is_from_cache()
+    client.carrier(params={"code": 2})
+    # Least recently used response was evicted, hishel cache answers it
+    assert client.carrier(params={"code": 1}) == first
+    assert client.carrier(params={"code": 1}) is not first
+    assert len(httpx_mock.get_requests()) == 2
+
+    async def run():
+        async with AsyncYaraspClient(
+            cache_storage=hishel.AsyncFileStorage(base_path=storage_path / "async"),
+            counter_storage_path=str(tmp_path / "async_counter.json"),
+            memory_cache_size=8,
+        ) as async_client:
+            first = await async_client.carrier(params={"code": 1})
+            assert await async_client.carrier(params={"code": 1}) is first
+            assert async_client.is_from_cache()
+
+    asyncio.run(run())
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_cache_hit_skips_limit_checks(httpx_mock, tmp_path, monkeypatch):
+    """Test that cache hits bypass logging and usage counter checks."""
+    httpx_mock.add_response(json={"carrier": {"code": 1}}, is_reusable=True)
+    client = YaraspClient(
+        cache_storage=hishel.FileStorage(base_path=tmp_path / "cache"),
+        counter_storage_path=str(tmp_path / "counter.json"),
+    )
+    first = client.carrier(params={"code": 1})
+    assert client.last_response_from_cache is False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("_log_and_check_limits called for cache hit")
+
+    monkeypatch.setattr(YaraspClient, "_log_and_check_limits", fail)
+    assert client.carrier(params={"code": 1}) == first
+    assert client.last_response_from_cache is True
+    assert len(httpx_mock.get_requests()) == 1